@@ -0,0 +1,115 @@
+# this script measures the memory needed for datasets, xy datasets and plots of a synthetic workload
+# the workload is built with double and single precision data, other versions of the main script can be compared with --script
+
+# benchmark parameters
+datasetcount = 10000                    # number of datasets
+pointcount = 200                        # number of points per dataset
+
+
+
+############################################################### DO NOT EDIT BELOW ###############################################################
+# dependencies
+import os                               # operating system operations
+import sys                              # object sizes
+import gc                               # garbage collection
+import argparse                         # command line arguments
+import importlib.util                   # loading of main script
+import tracemalloc                      # memory tracing
+import time                             # timing
+import numpy as np                      # numerical python
+
+
+# load definitions of main script, the pipeline only runs when the script is executed directly
+def loadscript(path):
+    spec = importlib.util.spec_from_file_location("outfiletodata", path)
+    script = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(script)
+    return script
+
+
+# create synthetic blocks of datafiles with columns time step, flow time and noisy exponential approach curve
+# pairs of datafiles belong to the same case and share their flow time, as e.g. S108-8-contact-area and S108-8-v-frac-water
+def syntheticblocks(datasetcount, pointcount):
+    generator = np.random.default_rng(0)
+
+    blocks = []
+    for i in range(datasetcount):
+        if i % 2 == 0:
+            xdata = np.linspace(0.0, generator.uniform(1.0, 2.0), pointcount)
+        ydata = generator.uniform(10.0, 100.0)*(1.0 - np.exp(-xdata/generator.uniform(0.05, 0.3))) + generator.normal(0.0, 0.5, pointcount)
+        blocks.append(np.column_stack((np.arange(pointcount, dtype=np.float64), xdata, ydata)))
+    return blocks
+
+
+# build datasets, xy datasets and individual plots from blocks, as done by the main script after reading the datafiles
+def buildworkload(script, blocks):
+    quants = ["Time Step", "flow-time", "contact-area"]
+    xquant = script.Quantity("flow-time", "xdata", "Flow time [s]", 0.0, 1.0)
+    yquant = script.Quantity("contact-area", "ydata", "Contact area [mm^2]", 0.0, 1e6)
+
+    datasets = []
+    xydata = []
+    plots = []
+    for i, block in enumerate(blocks):
+        # older versions of the main script keep all columns and have no column selection
+        if hasattr(script, "selectcolumns"):
+            data = script.selectcolumns(block, [1, 2])
+            loaded = quants[1:]
+        else:
+            data = block.copy()
+            loaded = quants
+        dataset = script.Dataset(f"S{i}-1-contact-area", quants, data, f"S{i}-1-contact-area.out", {"size": 0, "offset": 0, "pending": 0})
+        datasets.append(dataset)
+
+        columns = script.scalecolumns({name: data[:, loaded.index(name)] for name in quants[1:]}, [xquant, yquant])
+        xdata = columns["flow-time"]
+        ydata = columns["contact-area"]
+
+        # older versions of the main script have no intern table
+        if hasattr(script, "internarray"):
+            xdata = script.internarray(xdata)
+        data = script.XYdata(dataset.getname(), xquant, yquant, xdata, ydata, dataset)
+        xydata.append(data)
+
+        plots.append(script.Plot(dataset.getname(), "", xquant.getdescr(), yquant.getdescr(), [xdata], [ydata], 0.0, 1.5, 0.0, 100.0, [dataset.getname()], [data]))
+    return datasets, xydata, plots
+
+
+# size of python object without referenced objects, including its attribute dictionary
+def objectsize(instance):
+    size = sys.getsizeof(instance)
+    if hasattr(instance, "__dict__"):
+        size += sys.getsizeof(instance.__dict__)
+    return size
+
+
+# build workload with floattype, returns traced memory in bytes, peak memory in bytes, time in s and object sizes in bytes
+def measure(script, blocks, floattype):
+    script.floattype = floattype
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    datasets, xydata, plots = buildworkload(script, blocks)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    sizes = {"dataset": objectsize(datasets[0]), "xy dataset": objectsize(xydata[0]), "statistics": objectsize(xydata[0].getxstats()), "plot": objectsize(plots[0])}
+    return current, peak, elapsed, sizes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure memory needed for datasets, xy datasets and plots of a synthetic workload.")
+    parser.add_argument("--datasets", type=int, default=datasetcount, help="number of datasets")
+    parser.add_argument("--points", type=int, default=pointcount, help="number of points per dataset")
+    parser.add_argument("--script", default=os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "out-file-to-data.py"), help="path of main script to be measured, e.g. an older version")
+    arguments = parser.parse_args()
+
+    script = loadscript(arguments.script)
+    blocks = syntheticblocks(arguments.datasets, arguments.points)
+    print(f"Building {arguments.datasets} dataset(s) of {arguments.points} point(s) each with {os.path.relpath(arguments.script)}.")
+
+    for floattype in ("float64", "float32"):
+        current, peak, elapsed, sizes = measure(script, blocks, floattype)
+        print(f"- {floattype}: {current/2**20:.1f} MB ({current/arguments.datasets:.0f} bytes per dataset), peak {peak/2**20:.1f} MB, {elapsed:.2f} s")
+        print("    - object sizes: " + ", ".join(f"{name} {size} bytes" for name, size in sizes.items()))
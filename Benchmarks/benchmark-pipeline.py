@@ -0,0 +1,241 @@
+# this script measures the time needed by each stage of the pipeline for synthetic Fluent .out files
+# results are written to a JSON file and can be compared against a stored baseline to find regressions
+
+# benchmark parameters
+filecount = 20                          # number of datafiles
+rowcount = 10000                        # number of rows per datafile
+columncount = 4                         # number of columns per datafile (time step, flow time and columncount-2 y quantities)
+plotlimit = 10                          # maximum number of individual and combined plots rendered
+repeats = 3                             # number of runs, the minimum time of each stage is reported
+tolerance = 0.2                         # relative increase of time compared to baseline reported as regression
+timefloor = 0.005                       # increase of time in s compared to baseline below which no regression is reported
+
+
+
+############################################################### DO NOT EDIT BELOW ###############################################################
+# dependencies
+import os                               # operating system operations
+import sys                              # system operations
+import io                               # console output capture
+import json                             # results
+import argparse                         # command line arguments
+import contextlib                       # console output capture
+import importlib.util                   # loading of main script
+import platform                         # environment of results
+import tempfile                         # synthetic datafiles and output
+import time                             # timing
+import numpy as np                      # numerical python
+import matplotlib                       # python plotting
+matplotlib.use("Agg")
+
+
+# load definitions of main script, the pipeline only runs when the script is executed directly
+def loadscript():
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "out-file-to-data.py")
+    spec = importlib.util.spec_from_file_location("outfiletodata", path)
+    script = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(script)
+    return script
+
+
+# write synthetic datafiles with the header layout of Fluent .out files and a matching reference file
+# each file holds the time step, columncount-2 noisy exponential approach curves and the flow time
+def writedatafiles(directory, filecount, rowcount, columncount):
+    generator = np.random.default_rng(0)
+    ynames = [f"monitor-{k}" for k in range(1, columncount - 1)]
+    os.makedirs(os.path.join(directory, "Data"))
+
+    for i in range(filecount):
+        name = f"S{100 + i}-1-synthetic"
+        xdata = np.cumsum(generator.uniform(0.5e-4, 1.5e-4, rowcount))
+        columns = [np.arange(rowcount, dtype=np.float64)]
+        for k in range(len(ynames)):
+            columns.append(generator.uniform(10.0, 100.0)*(1.0 - np.exp(-xdata/generator.uniform(0.05, 0.3))) + generator.normal(0.0, 0.5, rowcount))
+        columns.append(xdata)
+
+        with open(os.path.join(directory, "Data", name + ".out"), "w") as file:
+            file.write(f"\"{name}-rfile\"\n")
+            file.write(f"\"Time Step\" \"{ynames[0] if len(ynames) > 0 else 'flow-time'} etc..\"\n")
+            file.write("(" + " ".join(f"\"{quant}\"" for quant in ["Time Step"] + ynames + ["flow-time"]) + ")\n")
+            np.savetxt(file, np.column_stack(columns), fmt="%.16g")
+
+    with open(os.path.join(directory, "reference_quantities.dat"), "w") as file:
+        file.write("Time Step?none?none?0.0?0.0\n")
+        file.write("flow-time?xdata?Flow Time [s]?0.0?1.0\n")
+        for yname in ynames:
+            file.write(f"{yname}?ydata?{yname} [-]?0.0?1.0\n")
+
+
+# run all stages of the pipeline once, at most plotlimit plots are rendered per kind, returns time in s and number of processed items by stage
+def runpipeline(script, directory, plotlimit):
+    stages = {}
+    start = time.perf_counter()
+
+    # time and count of stage, started at the end of the previous stage
+    def stage(name, count):
+        nonlocal start
+        stages[name] = {"time": time.perf_counter() - start, "count": count}
+        start = time.perf_counter()
+
+    # discovery of datafiles
+    files, fields = script.findfiles(os.path.join(directory, "Data"))
+    paths = [os.path.join(directory, "Data", file) for file in sorted(files)]
+    stage("discovery", len(paths))
+
+    # parsing of headers and data
+    datasets = []
+    for path in paths:
+        quants, offset = script.readheader(path)
+        datasets.append(script.Dataset(os.path.splitext(os.path.basename(path))[0], quants, None, path, None))
+    results = script.readfiles(paths, [dataset.getquants() for dataset in datasets])
+    for dataset, (quants, data, position, loaded) in zip(datasets, results):
+        dataset.setdata(data, position, loaded)
+    stage("parsing", sum(len(dataset.getdata()) for dataset in datasets))
+
+    # matching of quantities with reference file
+    registry = script.Registry()
+    for dataset in datasets:
+        registry.adddataset(dataset)
+    references = script.readreferences(os.path.join(directory, "reference_quantities.dat"))
+    for quant in registry.getquantities():
+        reference = references.getquantity(quant.getname())
+        if reference is not None:
+            quant.settype(reference.gettype())
+            quant.setdescr(reference.getdescr())
+            quant.setoffset(reference.getoffset())
+            quant.setfactor(reference.getfactor())
+    stage("quantities", registry.getcount())
+
+    # creation of xy datasets
+    xydata = []
+    for dataset in datasets:
+        xquants = registry.gettyped(dataset.getquants(), "xdata")
+        yquants = registry.gettyped(dataset.getquants(), "ydata")
+        columns = script.scalecolumns({quant.getname(): dataset.getcolumn(quant.getname()) for quant in xquants + yquants}, xquants + yquants)
+        for xquant in xquants:
+            columns[xquant.getname()] = script.internarray(columns[xquant.getname()])
+            for yquant in yquants:
+                xydata.append(script.XYdata(f"{dataset.getname()}-{yquant.getname()}", xquant, yquant, columns[xquant.getname()], columns[yquant.getname()], dataset))
+    stage("xydata", len(xydata))
+
+    # export formats, binary formats are skipped if their package is not installed
+    os.chdir(os.path.join(directory, "Output"))
+    for data in xydata:
+        script.writexydata(data.getheader() + ".txt", [], data.getxdata(), data.getydata(), f"[{script.numberformat()},{script.numberformat()}]", ",", "[", "]\n")
+    stage("export-maple", len(xydata))
+    for data in xydata:
+        script.writexydata(data.getheader() + ".txt", [], data.getxdata(), data.getydata(), script.numberformat() + "," + script.numberformat(), "\n", "", "\n")
+    stage("export-other", len(xydata))
+    for name, extension in (("export-numpy", ".npz"), ("export-hdf5", ".h5"), ("export-parquet", ".parquet")):
+        try:
+            for data in xydata:
+                script.writebinary(data.getheader() + extension, data)
+            stage(name, len(xydata))
+        except ImportError:
+            stage(name, None)
+            stages[name]["time"] = None
+
+    # individual plots
+    plots = []
+    for data in xydata[:plotlimit]:
+        xmin, xmax = script.getminmax([data], "xdata")
+        ymin, ymax = script.getminmax([data], "ydata")
+        plots.append(script.Plot(data.getheader(), data.getheader(), data.getxquant().getdescr(), data.getyquant().getdescr(), [data.getxdata()], [data.getydata()], xmin, xmax, ymin, ymax, [data.getheader()], [data]))
+    script.createplots(plots)
+    stage("plots-individual", len(plots))
+
+    # combined plots of xy datasets with matching quantities
+    plots = []
+    for sets in script.Grouping(xydata).getgroups()[:plotlimit]:
+        xmin, xmax = script.getminmax(sets, "xdata")
+        ymin, ymax = script.getminmax(sets, "ydata")
+        name = f"{sets[0].getxquant().getname()}-{sets[0].getyquant().getname()}"
+        plots.append(script.Plot(name, name, sets[0].getxquant().getdescr(), sets[0].getyquant().getdescr(), [data.getxdata() for data in sets], [data.getydata() for data in sets], xmin, xmax, ymin, ymax, [data.getheader() for data in sets], sets))
+    script.createplots(plots)
+    stage("plots-combined", len(plots))
+
+    return stages
+
+
+# compare stages with baseline, returns names of stages exceeding the baseline time by more than tolerance and timefloor
+def compare(stages, baseline, tolerance, timefloor):
+    regressions = []
+    print("\nComparison with baseline:")
+    for name, entry in stages.items():
+        reference = baseline["stages"].get(name)
+        if reference is None or reference["time"] is None or entry["time"] is None:
+            print(f"- {name}: no baseline")
+            continue
+        ratio = entry["time"]/reference["time"] if reference["time"] > 0 else np.inf
+        if ratio > 1.0 + tolerance and entry["time"] - reference["time"] > timefloor:
+            regressions.append(name)
+            print(f"- {name}: {entry['time']:.3f} s, baseline {reference['time']:.3f} s ({ratio:.2f}x, regression)")
+        else:
+            print(f"- {name}: {entry['time']:.3f} s, baseline {reference['time']:.3f} s ({ratio:.2f}x)")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure time needed by each stage of the pipeline for synthetic Fluent .out files.")
+    parser.add_argument("--files", type=int, default=filecount, help="number of datafiles")
+    parser.add_argument("--rows", type=int, default=rowcount, help="number of rows per datafile")
+    parser.add_argument("--columns", type=int, default=columncount, help="number of columns per datafile, at least 3")
+    parser.add_argument("--plots", type=int, default=plotlimit, help="maximum number of individual and combined plots rendered")
+    parser.add_argument("--repeats", type=int, default=repeats, help="number of runs, the minimum time of each stage is reported")
+    parser.add_argument("--output", help="JSON file the results are written to")
+    parser.add_argument("--baseline", help="JSON file of previous results to compare with, exits with code 1 on regressions")
+    parser.add_argument("--tolerance", type=float, default=tolerance, help="relative increase of time compared to baseline reported as regression")
+    parser.add_argument("--floor", type=float, default=timefloor, help="increase of time in s compared to baseline below which no regression is reported")
+    arguments = parser.parse_args()
+
+    if arguments.columns < 3:
+        parser.error("at least 3 columns are required")
+
+    # script settings, caching is disabled to measure parsing
+    script = loadscript()
+    script.cachename = ""
+
+    parameters = {"files": arguments.files, "rows": arguments.rows, "columns": arguments.columns, "plots": arguments.plots, "repeats": arguments.repeats}
+    print(f"Running pipeline for {arguments.files} datafile(s) of {arguments.rows} row(s) and {arguments.columns} column(s), {arguments.repeats} run(s).")
+
+    workdir = os.getcwd()
+    stages = {}
+    with tempfile.TemporaryDirectory() as directory:
+        writedatafiles(directory, arguments.files, arguments.rows, arguments.columns)
+
+        for run in range(arguments.repeats):
+            os.makedirs(os.path.join(directory, "Output"), exist_ok=True)
+            with contextlib.redirect_stdout(io.StringIO()):
+                results = runpipeline(script, directory, arguments.plots)
+            os.chdir(workdir)
+
+            # minimum time of each stage
+            for name, entry in results.items():
+                if name not in stages or (entry["time"] is not None and entry["time"] < stages[name]["time"]):
+                    stages[name] = entry
+
+    for name, entry in stages.items():
+        if entry["time"] is None:
+            print(f"- {name}: skipped, required package is not installed")
+        else:
+            print(f"- {name}: {entry['time']:.3f} s ({entry['count']} item(s))")
+
+    # results
+    results = {"parameters": parameters, "environment": {"python": platform.python_version(), "numpy": np.__version__, "matplotlib": matplotlib.__version__, "platform": platform.platform(), "cpus": os.cpu_count()}, "stages": stages}
+    if arguments.output is not None:
+        with open(arguments.output, "w") as file:
+            json.dump(results, file, indent=4)
+            file.close()
+        print(f"\nResults written to '{arguments.output}'")
+
+    # comparison with baseline
+    if arguments.baseline is not None:
+        with open(arguments.baseline, "r") as file:
+            baseline = json.load(file)
+            file.close()
+        if baseline["parameters"] != parameters:
+            print(f"{script.Fore.RED}\nParameters of baseline differ from current run.{script.Style.RESET_ALL}")
+        regressions = compare(stages, baseline, arguments.tolerance, arguments.floor)
+        if len(regressions) > 0:
+            print(f"{script.Fore.RED}\nRegressions in {len(regressions)} stage(s): {', '.join(regressions)}{script.Style.RESET_ALL}")
+            sys.exit(1)
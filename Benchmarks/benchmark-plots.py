@@ -0,0 +1,85 @@
+# this script measures the time needed to create plots from synthetic data
+# plots are created with a new figure and line per dataset and with the reused template figure and line collection
+
+# benchmark parameters
+plotcount = 10                          # number of plots created per renderer
+datasetcount = 200                      # number of datasets per plot
+pointcount = 2000                       # number of points per dataset
+
+
+
+############################################################### DO NOT EDIT BELOW ###############################################################
+# dependencies
+import os                               # operating system operations
+import argparse                         # command line arguments
+import importlib.util                   # loading of main script
+import tempfile                         # output directory
+import numpy as np                      # numerical python
+import matplotlib                       # python plotting
+matplotlib.use("Agg")
+
+
+# load definitions of main script, the pipeline only runs when the script is executed directly
+def loadscript():
+    path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "out-file-to-data.py")
+    spec = importlib.util.spec_from_file_location("outfiletodata", path)
+    script = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(script)
+    return script
+
+
+# create synthetic plots with datasets of noisy exponential approach curves
+def syntheticplots(script, plotcount, datasetcount, pointcount):
+    generator = np.random.default_rng(0)
+    xdata = np.linspace(0.0, 1.5, pointcount)
+
+    plots = []
+    for i in range(plotcount):
+        xdatasets = []
+        ydatasets = []
+        legend = []
+        for j in range(datasetcount):
+            final = generator.uniform(10.0, 100.0)
+            ydata = final*(1.0 - np.exp(-xdata/generator.uniform(0.05, 0.3))) + generator.normal(0.0, 0.5, pointcount)
+            xdatasets.append(xdata)
+            ydatasets.append(ydata)
+            legend.append(f"set{j}")
+        ymin = min(np.min(ydata) for ydata in ydatasets)
+        ymax = max(np.max(ydata) for ydata in ydatasets)
+        plots.append(script.Plot(f"benchmark-{i}", f"Benchmark plot {i}", "x", "y", xdatasets, ydatasets, 0.0, 1.5, ymin, ymax, legend, []))
+    return plots
+
+
+# create all plots with renderer, returns time per plot in s
+def measure(script, plots, reuse):
+    script.reusefigure = reuse
+    times = []
+    for plot in plots:
+        filename, elapsed = script.createplot(plot)
+        times.append(elapsed)
+    return times
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure time needed to create plots with and without template figure reuse.")
+    parser.add_argument("--plots", type=int, default=plotcount, help="number of plots created per renderer")
+    parser.add_argument("--datasets", type=int, default=datasetcount, help="number of datasets per plot")
+    parser.add_argument("--points", type=int, default=pointcount, help="number of points per dataset")
+    arguments = parser.parse_args()
+
+    script = loadscript()
+    plots = syntheticplots(script, arguments.plots, arguments.datasets, arguments.points)
+    print(f"Creating {arguments.plots} plot(s) with {arguments.datasets} dataset(s) of {arguments.points} point(s) each.")
+
+    # plots are written to temporary directory
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        results = {}
+        for name, reuse in (("new figure, line per dataset", False), ("template figure, line collection", True)):
+            times = measure(script, plots, reuse)
+            results[name] = times
+            print(f"- {name}: {np.mean(times):.3f} s per plot (first {times[0]:.3f} s, minimum {np.min(times):.3f} s)")
+        os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    baseline, reused = results.values()
+    print(f"Speedup of template figure: {np.mean(baseline)/np.mean(reused):.2f}x")
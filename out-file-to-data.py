@@ -6,7 +6,33 @@ dataname = "Data"                       # name of subfolder containing data
 reffile = "reference_quantities.dat"    # name of file containing reference quantities
 ref_delimiter = "?"                     # delimiter used in reffile (caution, only change when explicitly relevant!)
 
-prec = 6                                # numerical precision for statistics
+recursive = True                        # search subfolders of data directory for datafiles
+includeglobs = ["*.out"]                # glob patterns of datafile paths relative to data directory to be included
+excludeglobs = []                       # glob patterns of datafile and subfolder paths relative to data directory to be excluded
+namepattern = r"^(?P<series>[A-Za-z]+)(?P<case>\d+)-(?P<run>\d+)-(?P<monitor>.+)$"    # regular expression with named groups parsing datafile names into fields for selection
+
+membudget = 512                         # peak memory budget in MB for reading a single datafile
+scratchdir = ""                         # directory for memory-mapped data of files exceeding the memory budget (empty: system temp directory)
+
+cachename = ".cache"                    # name of subfolder for cached data of processed datafiles (empty: no caching)
+cachesize = 2048                        # maximum size of cache in MB, least recently used entries are removed first
+cachehash = False                       # validate cached data by content hash of datafile in addition to size and modification time
+resetcache = False                      # clear cache before processing datafiles
+
+storename = "results.db"                # name of result store file collecting datasets of all runs (empty: no result store)
+casepattern = r"^[^-]*-[^-]*"           # regular expression matching the case name at the start of datafile names (first group if defined)
+
+followinterval = 10                     # polling interval in s when following datafiles that are still being written
+
+workers = 1                             # number of worker processes for reading datafiles (0: number of available cores)
+floattype = "float64"                   # floating point type of extracted data: double precision ("float64"), single precision ("float32", half the memory, about 7 significant digits)
+
+prec = 6                                # numerical precision for statistics and written data in significant digits (0: full precision)
+convtol = 0.01                          # relative tolerance of settled value (or range of data if larger) for convergence detection
+convwindow = 10                         # number of points averaged in rolling window for convergence detection
+resamplepoints = 1000                   # number of points of automatic common x grid for resampling
+resamplemethod = "linear"               # interpolation for resampling: linear ("linear"), zero-order hold ("hold")
+exportrows = 65536                      # number of rows formatted at once when writing data to files
 
 # global plot options
 figxsize = 16                           # figure x size
@@ -18,6 +44,14 @@ axisfontsize = 20                       # axes font size
 legendfontsize = 20                     # legend font size
 resolution = 300                        # plot resolution in dpi
 plottype = "plot"                       # plot type: lineplot ("plot"), pointplot ("scatter")
+decimation = "minmax"                   # reduction of long series in lineplots to figxsize*resolution pixel columns: minimum and maximum per column ("minmax"), largest triangle three buckets ("lttb"), none ("none")
+reusefigure = True                      # reuse template figure for all plots and draw lines of each plot as a single collection (False: new figure and line per dataset)
+plotworkers = 1                         # number of worker processes for creating plots (0: number of available cores)
+
+# profiling options
+profiling = False                       # record wall time, cpu time, peak memory and counts of pipeline stages, files and plots, summary printed at end of run
+tracefile = ""                          # name of JSON trace file the records are written to at end of run (empty: no trace)
+profilestage = ""                       # name of stage profiled with cProfile, e.g. "DATA PROCESSING" (empty: none)
 
 
 
@@ -25,25 +59,111 @@ plottype = "plot"                       # plot type: lineplot ("plot"), pointplo
 # dependencies
 import os                               # operating system operations
 import sys                              # system operations
+import argparse                         # command line arguments
+import tempfile                         # scratch files
+import shutil                           # file permissions
 import re                               # regular expressions
+import json                             # cache metadata
+import hashlib                          # cache keys and content hashes
+import warnings                         # warning control
+import itertools                        # iteration tools
+import fnmatch                          # glob patterns
+import time                             # polling interval
+import atexit                           # cleanup at exit
+import weakref                          # intern table
+import tracemalloc                      # memory profiling
+import cProfile                         # stage profiling
+import sqlite3                          # result store
+import concurrent.futures               # worker processes
+from multiprocessing import shared_memory, resource_tracker   # data exchange with worker processes
 import numpy as np                      # numerical python
 from matplotlib import pyplot as plt    # python plotting
+from matplotlib.figure import Figure    # template figure
+from matplotlib.collections import LineCollection, PolyCollection   # lines of multiple datasets
+from matplotlib.lines import Line2D     # legend entries
 from colorama import Fore, Style, init          # console output formatting (validated to run on a windows system)
 
 
-# change to directory containing the script
+# directory containing the script
 sourcedir = os.path.dirname(os.path.abspath(__file__))
-os.chdir(sourcedir)
 datadir = os.path.join(sourcedir, dataname)
+cachedir = os.path.join(sourcedir, cachename)
+
+# shared memory blocks holding data read by worker processes, attached in the main process
+sharedblocks = []
+
+# shared memory blocks created in a worker process, kept open until the worker exits so the main process can attach on windows
+workerblocks = []
+
+# template figure and axes reused for all plots created in the current process
+template = {}
+
+# profiling records of finished stages, files and plots, open records from outer stage to inner item
+records = []
+openrecords = []
+
+# interned x data by content hash, identical x data of several datasets is held once
+# entries are removed once no xy dataset refers to them anymore
+interned = weakref.WeakValueDictionary()
+
+# answers to queries from configuration file and command line, answers given in current session
+answers = {}
+recorded = {}
+batchmode = False                       # run without queries, unanswered queries use defaults
 
 
 
-print(f"{Style.BRIGHT}#################################################################### WELCOME ####################################################################{Style.RESET_ALL}")
 ############################################################## FUNCTION DEFINITION ##############################################################
+# returns answer to query, answers from configuration are used if available
+def answer(key, queryline, default):
+    # interactive query
+    if key not in answers and not batchmode:
+        value = input(queryline)
+        recorded[key] = value
+        return value
+
+    # answer from configuration or default
+    value = answers.get(key, default)
+    recorded[key] = value
+    if isinstance(value, bool):
+        value = "y" if value else "n"
+    elif isinstance(value, list):
+        value = " ".join(str(entry) for entry in value)
+    else:
+        value = str(value)
+    print(queryline + value)
+    return value
+
+
+# returns answer to query as list of entries, lists from configuration are used as given
+def answerlist(key, queryline):
+    if isinstance(answers.get(key), list):
+        entries = [str(entry) for entry in answers[key]]
+        recorded[key] = answers[key]
+        print(queryline + " ".join(entries))
+        return entries
+    return answer(key, queryline, "").strip().split()
+
+
+# report invalid answer, answers from configuration are queried again or end the program in batch mode
+def invalid(key, message):
+    print(message)
+    if batchmode:
+        print(f"{Fore.RED}\nInvalid answer for '{key}' in batch mode.\n\nExiting program.{Style.RESET_ALL}")
+        sys.exit(1)
+    answers.pop(key, None)
+
+
+# wait for user confirmation
+def pause(queryline):
+    if not batchmode:
+        input(queryline)
+
+
 # returns answer to yes/no query
-def ynquery(queryline):
+def ynquery(key, queryline, default):
     while True:
-        query = input(queryline).lower()
+        query = answer(key, queryline, default).lower()
 
         if query == "y":
             result = True
@@ -52,70 +172,691 @@ def ynquery(queryline):
             result = False
             break
         else:
-            print(f"{Fore.RED}Invalid input.\n{Style.RESET_ALL}")
+            invalid(key, f"{Fore.RED}Invalid input.\n{Style.RESET_ALL}")
+    recorded[key] = result
     print()
     return result
 
 
-# extract all lines from file
-def getlines(datafile):
+# read answers from configuration file (.json, .toml, .yaml), nested tables are flattened to keys separated by "."
+def readconfig(configfile):
+    extension = os.path.splitext(configfile)[1].lower()
+
+    if extension == ".json":
+        with open(configfile, "r") as file:
+            config = json.load(file)
+    elif extension == ".toml":
+        import tomllib
+        with open(configfile, "rb") as file:
+            config = tomllib.load(file)
+    elif extension in (".yaml", ".yml"):
+        import yaml
+        with open(configfile, "r") as file:
+            config = yaml.safe_load(file)
+    else:
+        raise ValueError(f"unknown configuration format '{extension}'")
+
+    return flattenconfig(config if config is not None else {}, "")
+
+
+# flatten nested configuration tables
+def flattenconfig(config, prefix):
+    flat = {}
+    for key, value in config.items():
+        if isinstance(value, dict):
+            flat.update(flattenconfig(value, f"{prefix}{key}."))
+        else:
+            flat[prefix + str(key)] = value
+    return flat
+
+
+# write answers to configuration file (.json, .toml, .yaml)
+def writeconfig(configfile, config):
+    extension = os.path.splitext(configfile)[1].lower()
+
+    if extension == ".json":
+        with open(configfile, "w") as file:
+            json.dump(config, file, indent=4)
+    elif extension == ".toml":
+        # flat keys and json values are valid toml
+        with open(configfile, "w") as file:
+            for key, value in config.items():
+                file.write(f"{json.dumps(key)} = {json.dumps(value)}\n")
+    elif extension in (".yaml", ".yml"):
+        import yaml
+        with open(configfile, "w") as file:
+            yaml.safe_dump(config, file, sort_keys=False)
+    else:
+        raise ValueError(f"unknown configuration format '{extension}'")
+
+
+# check if path relative to data directory matches any of the glob patterns
+def matchglobs(path, patterns):
+    path = path.replace(os.sep, "/")
+    return any(fnmatch.fnmatch(path, pattern) for pattern in patterns)
+
+
+# fields of datafile name parsed by namepattern, empty if not matching
+def namefields(path):
+    name = os.path.splitext(os.path.basename(path))[0]
+    match = re.match(namepattern, name)
+    if match is None:
+        return {}
+    return match.groupdict()
+
+
+# search directory for datafiles, subfolders are searched if recursive, hidden subfolders are skipped
+# returns paths relative to directory and modification times of searched directories
+def scanfiles(directory):
+    files = []
+    directories = {}
+    pending = [""]
+
+    while len(pending) > 0:
+        relative = pending.pop(0)
+        path = os.path.join(directory, relative)
+        directories[relative] = os.stat(path).st_mtime
+
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = os.path.join(relative, entry.name)
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive and not entry.name.startswith(".") and not matchglobs(name, excludeglobs):
+                        pending.append(name)
+                elif entry.is_file() and matchglobs(name, includeglobs) and not matchglobs(name, excludeglobs):
+                    files.append(name)
+
+    return files, directories
+
+
+# path of stored index of directory
+def indexpath(directory):
+    return os.path.join(cachedir, "index-" + hashlib.sha1(os.path.abspath(directory).encode()).hexdigest() + ".json")
+
+
+# find datafiles in directory, the stored index is used if search settings and modification times of searched directories are unchanged
+# returns paths relative to directory and fields parsed from their names
+def findfiles(directory):
+    settings = {"recursive": recursive, "include": includeglobs, "exclude": excludeglobs, "pattern": namepattern}
+
+    # stored index
+    if cachename != "":
+        try:
+            with open(indexpath(directory), "r") as file:
+                index = json.load(file)
+                file.close()
+            if index["settings"] == settings and all(os.stat(os.path.join(directory, relative)).st_mtime == mtime for relative, mtime in index["directories"].items()):
+                return index["files"], index["fields"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    # search directory and store index
+    files, directories = scanfiles(directory)
+    fields = {file: namefields(file) for file in files}
+    if cachename != "":
+        try:
+            os.makedirs(cachedir, exist_ok=True)
+            with open(indexpath(directory), "w") as file:
+                json.dump({"settings": settings, "directories": directories, "files": files, "fields": fields}, file)
+                file.close()
+        except OSError:
+            pass
+    return files, fields
+
+
+# extract quantities and position of data block from file
+def readheader(datafile):
+    quants = []
+    offset = 0
+    try:
+        with open(datafile, "rb") as file:
+            # find line containing quantitiy names
+            for line in iter(file.readline, b""):
+                if line.startswith(b"("):
+                    # extract quantity names, data starts after this line
+                    quants = line.decode().split('"')[1::2]
+                    offset = file.tell()
+                    break
+    except FileNotFoundError:
+        pass
+    return quants, offset
+
+
+# decode block of whitespace separated numbers into array with one column per quantity
+def parseblock(block, ncols):
+    # incomplete or non-numeric entries are reported as warnings by numpy
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            values = np.fromstring(block, dtype=np.float64, sep=" ")
+        except (ValueError, DeprecationWarning):
+            return None
+
+    # each row has to contain a value for every quantity
+    if ncols == 0 or values.size % ncols != 0:
+        return None
+
+    # values per line are counted by the starts of whitespace separated entries, blank lines hold no values
+    chars = np.frombuffer(block, dtype=np.uint8)
+    space = (chars == 32) | (chars == 9) | (chars == 10) | (chars == 13)
+    starts = ~space
+    starts[1:] &= space[:-1]
+    bounds = np.concatenate(([0], np.flatnonzero(chars == 10) + 1, [len(chars)]))
+    counts = np.diff(np.searchsorted(np.flatnonzero(starts), bounds))
+    if np.any((counts != 0) & (counts != ncols)):
+        return None
+    return values.reshape(-1, ncols)
+
+
+# select columns of decoded block and convert them to floattype, all columns are kept if usecols is None
+def selectcolumns(block, usecols):
+    if block is None:
+        return None
+    if usecols is not None:
+        block = block[:, usecols]
+    return block.astype(floattype, copy=False)
+
+
+# size of text chunks read from a datafile, chosen to stay within the memory budget
+def chunkbytes():
+    return max(int(membudget*2**20) // 8, 2**16)
+
+
+# read range of data block of file in chunks of complete rows, only columns in usecols are kept (None: all columns)
+def readchunks(datafile, start, stop, ncols, usecols, chunksize):
+    with open(datafile, "rb") as file:
+        file.seek(start)
+        remaining = stop - start
+        rest = b""
+
+        while remaining > 0:
+            block = file.read(min(chunksize, remaining))
+            if block == b"":
+                break
+            remaining -= len(block)
+
+            # hold back incomplete last line for next chunk
+            block = rest + block
+            end = block.rfind(b"\n") + 1
+            rest = block[end:]
+
+            chunk = selectcolumns(parseblock(block[:end], ncols), usecols)
+            if chunk is None:
+                yield None
+                return
+            if len(chunk) > 0:
+                yield chunk
+
+        # last line without line break
+        if rest.strip() != b"":
+            yield selectcolumns(parseblock(rest, ncols), usecols)
+
+
+# combine chunks into single array, data exceeding the memory budget is moved to a memory-mapped scratch file
+def collectchunks(chunks, ncols):
+    kept = []
+    keptbytes = 0
+    rows = 0
+    scratch = None
+
+    for chunk in chunks:
+        # invalid chunk
+        if chunk is None:
+            return None
+        rows += len(chunk)
+
+        # keep chunks in memory
+        if scratch is None:
+            kept.append(chunk)
+            keptbytes += chunk.nbytes
+
+            # memory budget exceeded, move data to scratch file
+            if keptbytes > int(membudget*2**20) // 2:
+                scratch = tempfile.TemporaryFile(dir=scratchdir if scratchdir != "" else None)
+                for entry in kept:
+                    entry.tofile(scratch)
+                kept = []
+
+        # append chunk to scratch file
+        else:
+            chunk.tofile(scratch)
+
+    # in memory data
+    if scratch is None:
+        if len(kept) == 0:
+            return np.empty((0, ncols), dtype=floattype)
+        return np.concatenate(kept)
+
+    # memory-mapped data
+    scratch.flush()
+    return np.memmap(scratch, dtype=floattype, mode="r", shape=(rows, ncols))
+
+
+# find offset after last line break in range of file
+def lineend(file, start, stop):
+    pos = stop
+    while pos > start:
+        size = min(2**16, pos - start)
+        file.seek(pos - size)
+        index = file.read(size).rfind(b"\n")
+        if index >= 0:
+            return pos - size + index + 1
+        pos -= size
+    return start
+
+
+# extract rows from range of data block, only columns in usecols are kept (None: all columns)
+# a last line without line break is only kept if complete and reported as pending, as it might still be written
+def readrange(datafile, start, stop, ncols, usecols):
+    width = ncols if usecols is None else len(usecols)
+    with open(datafile, "rb") as file:
+        end = lineend(file, start, stop)
+        file.seek(end)
+        rest = selectcolumns(parseblock(file.read(stop - end), ncols), usecols)
+
+        if rest is None:
+            rest = np.empty((0, width), dtype=floattype)
+
+        # decode small data blocks at once
+        if end - start <= chunkbytes():
+            file.seek(start)
+            data = selectcolumns(parseblock(file.read(end - start), ncols), usecols)
+            if data is not None:
+                data = np.concatenate((data, rest))
+
+    # stream large data blocks in chunks
+    if end - start > chunkbytes():
+        data = collectchunks(itertools.chain(readchunks(datafile, start, end, ncols, usecols, chunkbytes()), [rest]), width)
+
+    return data, end, len(rest)
+
+
+# extract quantities, data of selected quantities and read position from file
+# columns are kept in order of the file (names None: all quantities), returns quantities, data, read position and names of loaded columns
+def readoutfile(datafile, names):
+    quants, offset = readheader(datafile)
+    data = None
+    position = {"size": offset, "offset": offset, "pending": 0}
+
+    # positions of selected columns
+    if names is None:
+        loaded = list(quants)
+        usecols = None
+    else:
+        usecols = sorted(set(quants.index(name) for name in names if name in quants))
+        loaded = [quants[i] for i in usecols]
+
+    if len(quants) > 0:
+        size = os.path.getsize(datafile)
+        data, end, pending = readrange(datafile, offset, size, len(quants), usecols)
+        position = {"size": size, "offset": end, "pending": pending}
+
+    if data is None:
+        data = np.empty((0, len(loaded)), dtype=floattype)
+    return quants, data, position, loaded
+
+
+# extract rows appended to datafile since last read
+def followfile(dataset):
+    source = dataset.getsource()
+    position = dataset.getposition()
+    ncols = len(dataset.getquants())
+
+    try:
+        size = os.path.getsize(source)
+    except OSError:
+        return None
+
+    # no new data
+    if size == position["size"]:
+        return None
+
+    # file has been replaced or shortened
+    if size < position["size"]:
+        print(f"{Fore.RED}File {os.path.relpath(source, sourcedir)} has been shortened since last read.{Style.RESET_ALL} Skipping update.")
+        return None
+
+    data, end, pending = readrange(source, position["offset"], size, ncols, None)
+    if data is None:
+        print(f"{Fore.RED}New data in file {os.path.relpath(source, sourcedir)} is not in the correct format.{Style.RESET_ALL} Skipping update.")
+        return None
+
+    # rows of previously pending line are read again
+    drop = position["pending"]
+    dataset.extend(data, drop)
+    dataset.setposition({"size": size, "offset": end, "pending": pending})
+    return data, drop
+
+
+# extract quantities, data of selected quantities and read position from file and store them in cache
+def readdatafile(datafile, names):
+    record = beginrecord(currentstage(), os.path.relpath(datafile, sourcedir))
+    try:
+        quants, data, position, loaded = readoutfile(datafile, names)
+    except OSError:
+        endrecord(record)
+        return [], np.empty((0, 0)), None, []
+
+    if len(quants) > 0 and len(data) > 0:
+        storecache(datafile, quants, data, position, loaded)
+    endrecord(record, rows=len(data), columns=len(loaded))
+    return quants, data, position, loaded
+
+
+# read datafile in worker process, data is handed over through shared memory, returns reading time as well
+def readworker(datafile, names):
+    start = time.perf_counter()
+    quants, data, position, loaded = readdatafile(datafile, names)
+    elapsed = time.perf_counter() - start
+
+    # no usable data
+    if len(quants) == 0 or len(data) == 0:
+        return quants, None, position, loaded, elapsed
+
+    # data exceeding the memory budget is handed over through the cache
+    if isinstance(data, np.memmap) and cachename != "":
+        return quants, "cache", position, loaded, elapsed
+
+    block = shared_memory.SharedMemory(create=True, size=data.nbytes)
+    np.ndarray(data.shape, dtype=data.dtype, buffer=block.buf)[:] = data
+
+    # block is owned and unlinked by the main process, not by the resource tracker of the worker
+    if os.name != "nt":
+        resource_tracker.unregister(block._name, "shared_memory")
+    workerblocks.append(block)
+    return quants, (block.name, data.shape, data.dtype.str), position, loaded, elapsed
+
+
+# extract quantities, data of selected quantities and read positions from datafiles, results are returned in order of files
+def readfiles(datafiles, nameslist):
+    count = workers if workers > 0 else os.cpu_count()
+
+    # read in current process
+    if count == 1 or len(datafiles) < 2:
+        return [readdatafile(datafile, names) for datafile, names in zip(datafiles, nameslist)]
+
+    # read with pool of worker processes
+    results = []
+    with concurrent.futures.ProcessPoolExecutor(max_workers=min(count, len(datafiles))) as pool:
+        paths = [os.path.abspath(datafile) for datafile in datafiles]
+
+        for datafile, names, (quants, data, position, loaded, elapsed) in zip(datafiles, nameslist, pool.map(readworker, paths, nameslist)):
+            # no usable data
+            if data is None:
+                data = np.empty((0, len(loaded)), dtype=floattype)
+
+            # memory-mapped data from cache, read again if the cache could not be written
+            elif isinstance(data, str):
+                cached = loadcache(datafile, names)
+                if cached is not None:
+                    quants, data, position, loaded = cached
+                else:
+                    quants, data, position, loaded = readdatafile(datafile, names)
+
+            # data in shared memory, kept until exit
+            else:
+                block = shared_memory.SharedMemory(name=data[0])
+                sharedblocks.append(block)
+                data = np.ndarray(data[1], dtype=data[2], buffer=block.buf)
+
+            addrecord(currentstage(), os.path.relpath(datafile, sourcedir), elapsed, rows=len(data), columns=len(loaded))
+            results.append((quants, data, position, loaded))
+    return results
+
+
+# load data of quantities in names for each dataset, from cache if available, returns datasets with usable data
+def loaddatasets(datasets, nameslist):
+    count = workers if workers > 0 else os.cpu_count()
+    print(f"Processing {len(datasets)} datafile(s) using {count} worker process(es):")
+
+    # load data from cache
+    cached = [loadcache(dataset.getsource(), names) for dataset, names in zip(datasets, nameslist)]
+
+    # extract data from remaining files
+    misses = [(dataset.getsource(), names) for dataset, names, entry in zip(datasets, nameslist, cached) if entry is None]
+    extracted = iter(readfiles([source for source, names in misses], [names for source, names in misses]))
+
+    valid = []
+    for dataset, entry in zip(datasets, cached):
+        if entry is not None:
+            quants, data, position, loaded = entry
+        else:
+            quants, data, position, loaded = next(extracted)
+        file = os.path.relpath(dataset.getsource(), sourcedir)
+
+        # skip file if no usable data has been found
+        if len(quants) == 0 or len(data) == 0:
+            print(f"{Fore.RED}File {file} is not in the correct format or could not be opened.\n{Style.RESET_ALL}")
+            continue
+
+        dataset.setdata(data, position, loaded)
+        valid.append(dataset)
+
+        if entry is not None:
+            print(f"Loaded data of file {file} from cache")
+        elif isinstance(data, np.memmap):
+            print(f"Extracted data from file {file} (memory-mapped, exceeds memory budget)")
+        else:
+            print(f"Extracted data from file {file}")
+
+    # cache is pruned once in the main process after extracted files have been stored
+    if len(misses) > 0:
+        prunecache()
+    return valid
+
+
+# release shared memory blocks
+def releaseshared():
+    for block in sharedblocks:
+        try:
+            block.unlink()
+        except OSError:
+            pass
+
+
+atexit.register(releaseshared)
+
+
+# content hash of file
+def filehash(datafile):
+    digest = hashlib.blake2b()
+    with open(datafile, "rb") as file:
+        for block in iter(lambda: file.read(2**20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+# paths of cache entry for file
+def cachepaths(datafile):
+    key = hashlib.sha1(os.path.abspath(datafile).encode()).hexdigest()
+    return os.path.join(cachedir, key + ".json"), os.path.join(cachedir, key + ".npy")
+
+
+# load quantities, data and read position of file from cache, the entry has to contain all columns in names (None: all quantities)
+# returns quantities, data, read position and names of cached columns, None if no valid entry exists
+def loadcache(datafile, names):
+    if cachename == "":
+        return None
+    metafile, arrayfile = cachepaths(datafile)
+
+    try:
+        with open(metafile, "r") as file:
+            meta = json.load(file)
+        stat = os.stat(datafile)
+
+        # entry has to match current state of file
+        if meta["size"] != stat.st_size or meta["mtime"] != stat.st_mtime_ns:
+            return None
+        if cachehash and meta.get("hash") != filehash(datafile):
+            return None
+
+        quants = meta["quants"]
+        position = meta["position"]
+        loaded = meta["loaded"]
+        if not set(quants if names is None else names) <= set(loaded):
+            return None
+        data = np.load(arrayfile, mmap_mode="r")
+    except (OSError, ValueError, KeyError):
+        return None
+
+    # entries of a different floattype are extracted again
+    if data.dtype != np.dtype(floattype):
+        return None
+
+    # mark entry as recently used
+    os.utime(metafile)
+    return quants, data, position, loaded
+
+
+# store quantities, data of loaded columns and read position of file in cache
+def storecache(datafile, quants, data, position, loaded):
+    if cachename == "":
+        return
+    metafile, arrayfile = cachepaths(datafile)
+    stat = os.stat(datafile)
+
+    meta = {"source": os.path.abspath(datafile), "size": stat.st_size, "mtime": stat.st_mtime_ns, "quants": quants, "position": position, "loaded": loaded}
+    if cachehash:
+        meta["hash"] = filehash(datafile)
+
+    try:
+        os.makedirs(cachedir, exist_ok=True)
+
+        # write to temporary files first, entries are only valid once both files are complete
+        with open(arrayfile + ".tmp", "wb") as file:
+            np.save(file, data)
+        os.replace(arrayfile + ".tmp", arrayfile)
+        with open(metafile + ".tmp", "w") as file:
+            json.dump(meta, file)
+        os.replace(metafile + ".tmp", metafile)
+    except OSError:
+        print(f"{Fore.RED}Could not write cache entry for file {datafile}.{Style.RESET_ALL}")
+        return
+
+
+# remove least recently used cache entries exceeding the cache size, called once after files have been stored
+def prunecache():
+    if cachename == "" or not os.path.isdir(cachedir):
+        return
+    entries = []
+    total = 0
+    for entry in os.scandir(cachedir):
+        if entry.name.endswith(".json") and not entry.name.startswith("index-"):
+            arrayfile = entry.path[:-len(".json")] + ".npy"
+            # entries might be removed by other processes
+            try:
+                used = entry.stat().st_mtime
+                size = entry.stat().st_size + os.path.getsize(arrayfile)
+            except OSError:
+                continue
+            entries.append((used, entry.path, arrayfile, size))
+            total += size
+
+    # oldest entries first
+    entries.sort()
+    for used, metafile, arrayfile, size in entries:
+        if total <= cachesize*2**20:
+            break
+        for path in (metafile, arrayfile):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        total -= size
+
+
+# remove all cache entries, indexes of data directories are kept as they are validated by modification times
+def clearcache():
+    if not os.path.isdir(cachedir):
+        return 0
+    count = 0
+    for entry in os.scandir(cachedir):
+        if entry.name.startswith("index-"):
+            continue
+        if entry.name.endswith((".json", ".npy", ".tmp")):
+            os.remove(entry.path)
+            count += entry.name.endswith(".json")
+    return count
+
+
+# read reference quantities from file into registry, entries with invalid fields are skipped
+def readreferences(filename):
+    references = Registry()
+    with open(filename, "r") as file:
+        for line in file:
+            entries = line.strip().split(ref_delimiter)
+
+            # add reference quantity if its entries are valid
+            if len(entries) == 5:
+                try:
+                    references.addquantity(Quantity(entries[0], entries[1], entries[2], entries[3], entries[4]))
+                except ValueError:
+                    pass
+        file.close()
+    return references
+
+
+# write changed reference quantities to file, the file is replaced at once
+# lines of changed quantities are replaced by exact name, new quantities are appended, returns numbers of replaced and appended lines
+def writereferences(filename, changes):
     try:
-        with open(datafile, 'r') as file:
-            # get file contents
+        with open(filename, "r") as file:
             lines = file.readlines()
             file.close()
     except FileNotFoundError:
         lines = []
-    return lines
-
-
-# extract quantities from file
-def getquants(lines):
-    # extract quantities
-    if len(lines) > 0:
-        # find line containing quantitiy names
-        quantline = ""
-        for index in range(len(lines)):
-            if lines[index].startswith("("):
-                quantline = lines[index]
-                break
-        # extract quantity names
-        quants = quantline.split('"')[1::2]
-    else:
-        quants = []
-    return quants
-
-
-# extract data from file
-def getdata(lines):
-    # extract quantities
-    if len(lines) > 0:
-        # find line containing quantitiy names
-        quantindex = 0
-        for index in range(len(lines)):
-            if lines[index].startswith("("):
-                quantindex = index
-                break
-        # extract data
-        datalines = lines[quantindex+1:]
-        data = []
-        for line in datalines:
-            data.append(line.strip().split())
-    else:
-        data = []
-    return data
+
+    # replace lines of existing quantities
+    pending = dict(changes)
+    replaced = 0
+    for index in range(len(lines)):
+        name = lines[index].strip().split(ref_delimiter)[0]
+        if name in pending:
+            lines[index] = pending.pop(name).getref() + "\n"
+            replaced += 1
+
+    # append new quantities
+    if len(lines) > 0 and not lines[-1].endswith("\n"):
+        lines[-1] += "\n"
+    lines.extend([quant.getref() + "\n" for quant in pending.values()])
+
+    # write temporary file next to reference file and replace reference file, the temporary file is removed on errors
+    directory = os.path.dirname(os.path.abspath(filename))
+    with tempfile.NamedTemporaryFile("w", dir=directory, prefix=".reference-", delete=False) as file:
+        temporary = file.name
+    try:
+        with open(temporary, "w") as file:
+            file.writelines(lines)
+            file.close()
+
+        # permissions of existing reference file are kept, new files get the default permissions
+        if os.path.exists(filename):
+            shutil.copymode(filename, temporary)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temporary, 0o666 & ~umask)
+        os.replace(temporary, filename)
+    except BaseException:
+        try:
+            os.remove(temporary)
+        except OSError:
+            pass
+        raise
+    return replaced, len(pending)
 
 
 # set quantity parameters
 def setquantities(quant, type):
     quant.settype(type)
+    key = f"quantities.{quant.getname()}"
 
-    descr = input("\nEnter description of quantity:\n>>> ")
+    descr = answer(f"{key}.descr", "\nEnter description of quantity:\n>>> ", quant.getname())
     quant.setdescr(descr)
 
     # offset definition
     while True:
-        q_offset = input(f"\nDefine global value offset for quantity '{quant.getname()}'.\nLeave blank for no offset.\n>>> (0.0) ")
+        q_offset = answer(f"{key}.offset", f"\nDefine global value offset for quantity '{quant.getname()}'.\nLeave blank for no offset.\n>>> (0.0) ", "")
         try:
             offset = float(q_offset)
             quant.setoffset(offset)
@@ -124,11 +865,11 @@ def setquantities(quant, type):
             if q_offset == "":
                 quant.setoffset(0.0)
                 break
-            print(f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter a valid number or leave the prompt blank.")
+            invalid(f"{key}.offset", f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter a valid number or leave the prompt blank.")
 
     # scaling factor definition
     while True:
-        q_factor = input(f"\nDefine global value scaling factor for quantity '{quant.getname()}'.\nLeave blank for no scaling.\n>>> (1.0) ")
+        q_factor = answer(f"{key}.factor", f"\nDefine global value scaling factor for quantity '{quant.getname()}'.\nLeave blank for no scaling.\n>>> (1.0) ", "")
         try:
             factor = float(q_factor)
             quant.setfactor(factor)
@@ -137,43 +878,407 @@ def setquantities(quant, type):
             if q_factor == "":
                 quant.setfactor(1.0)
                 break
-            print(f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter a valid number or leave the prompt blank.")
-        break
+            invalid(f"{key}.factor", f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter a valid number or leave the prompt blank.")
+
+
+# scale data columns with offset and factor of their quantities, returns read-only columns by quantity name
+# columns are taken from data by name, e.g. from a dictionary or the columns of a dataset, unscaled columns are returned as views without copy
+def scalecolumns(data, quantlist):
+    columns = {}
+    for quant in quantlist:
+        if quant.getname() in columns:
+            continue
+        if quant.getfactor() == 1.0 and quant.getoffset() == 0.0:
+            columns[quant.getname()] = readonly(data[quant.getname()])
+        else:
+            columns[quant.getname()] = readonly(scalecolumn(data[quant.getname()], quant.getfactor(), quant.getoffset()))
+    return columns
+
+
+# scaled copy of column, memory-mapped columns are scaled in blocks of exportrows into a memory-mapped scratch file
+def scalecolumn(values, factor, offset):
+    if not isinstance(values, np.memmap):
+        return factor*(values + offset)
+
+    scratch = tempfile.TemporaryFile(dir=scratchdir if scratchdir != "" else None)
+    scaled = np.memmap(scratch, dtype=values.dtype, mode="w+", shape=values.shape)
+    for i in range(0, len(values), exportrows):
+        scaled[i:i + exportrows] = factor*(values[i:i + exportrows] + offset)
+    scaled.flush()
+    return scaled
+
+
+# read-only view of array, the array itself stays writable
+def readonly(values):
+    view = values.view()
+    view.flags.writeable = False
+    return view
+
+
+# interned array with the same content as values, values are added to the intern table if no such array exists
+# values are hashed and compared in blocks of exportrows, memory-mapped columns are not loaded at once
+def internarray(values):
+    digest = hashlib.blake2b()
+    for i in range(0, len(values), exportrows):
+        digest.update(np.ascontiguousarray(values[i:i + exportrows]).data)
+    key = (values.dtype.str, values.shape, digest.hexdigest())
+    existing = interned.get(key)
+    if existing is not None and all(np.array_equal(existing[i:i + exportrows], values[i:i + exportrows]) for i in range(0, len(values), exportrows)):
+        return existing
+    values = readonly(values)
+    interned[key] = values
+    return values
+
+
+# append values to array with geometrically growing storage, the last drop values are replaced
+# returns storage and array of valid values
+def growarray(storage, data, values, drop):
+    count = len(data) - drop
+    total = count + len(values)
+
+    if storage is None or len(storage) < total:
+        grown = np.empty((max(2*total, 1024),) + data.shape[1:], dtype=data.dtype)
+        grown[:count] = data[:count]
+        storage = grown
+
+    storage[count:total] = values
+    return storage, storage[:total]
+
+
+# format of numbers in written data
+def numberformat():
+    if prec > 0:
+        return f"%.{prec}g"
+    else:
+        return "%r"
+
+
+# write header lines and x and y data to file, rows are formatted in blocks of exportrows
+# rowformat contains two fields for x and y value, rows are joined by separator and enclosed by start and end
+def writexydata(filename, header, xdata, ydata, rowformat, separator, start, end):
+    with open(filename, "w", buffering=1048576) as file:
+        file.writelines(header)
+        file.write(start)
+
+        for i in range(0, len(xdata), exportrows):
+            # interleave x and y values of block
+            block = np.empty(2*len(xdata[i:i + exportrows]))
+            block[0::2] = xdata[i:i + exportrows]
+            block[1::2] = ydata[i:i + exportrows]
+            rows = len(block)//2
+
+            # separator is written before all but the first row
+            if i > 0:
+                file.write(separator)
+            file.write(separator.join([rowformat]*rows) % tuple(block.tolist()))
+
+        file.write(end)
+        file.close()
+
+
+# case name of datafile, matched by casepattern, whole name if not matching
+def casename(name):
+    match = re.match(casepattern, name)
+    if match is None:
+        return name
+    elif match.groups():
+        return match.group(1)
+    else:
+        return match.group(0)
+
+
+# open result store, tables and indexes are created if not existing
+def openstore(storefile):
+    store = sqlite3.connect(storefile)
+    store.executescript("""
+        CREATE TABLE IF NOT EXISTS datasets (id INTEGER PRIMARY KEY, name TEXT, casename TEXT, source TEXT UNIQUE, size INTEGER, mtime REAL, offset INTEGER, pending INTEGER, rows INTEGER, quants TEXT);
+        CREATE TABLE IF NOT EXISTS columns (dataset INTEGER, quantity TEXT, position INTEGER, dtype TEXT, data BLOB, PRIMARY KEY (dataset, quantity));
+        CREATE TABLE IF NOT EXISTS quantities (name TEXT PRIMARY KEY, type TEXT, descr TEXT, offset REAL, factor REAL);
+        CREATE INDEX IF NOT EXISTS datasetscase ON datasets (casename);
+        CREATE INDEX IF NOT EXISTS columnsquantity ON columns (quantity);
+    """)
+
+    # stores created before quantities of files were stored
+    if "quants" not in [entry[1] for entry in store.execute("PRAGMA table_info(datasets)")]:
+        store.execute("ALTER TABLE datasets ADD COLUMN quants TEXT")
+    return store
+
+
+# add datasets and quantity settings to result store, stored datasets of changed files are replaced
+# returns number of added datasets
+def writestore(storefile, datasets, quantities):
+    store = openstore(storefile)
+    added = 0
+
+    with store:
+        for dataset in datasets:
+            source = os.path.abspath(dataset.getsource())
+            try:
+                stat = os.stat(source)
+            except OSError:
+                continue
+
+            # data of loaded columns, datasets without data are skipped
+            data = dataset.getarray()
+            position = dataset.getposition()
+            mtime = stat.st_mtime
+            if position is None:
+                continue
+
+            # skip datasets of unchanged files already holding the loaded columns, remove outdated entries
+            entry = store.execute("SELECT id, size, mtime FROM datasets WHERE source = ?", (source,)).fetchone()
+            if entry is not None:
+                stored = set(row[0] for row in store.execute("SELECT quantity FROM columns WHERE dataset = ?", (entry[0],)))
+                if entry[1] == stat.st_size and entry[2] == stat.st_mtime and stored >= set(dataset.getloaded()):
+                    continue
+                store.execute("DELETE FROM columns WHERE dataset = ?", (entry[0],))
+                store.execute("DELETE FROM datasets WHERE id = ?", (entry[0],))
+
+            # one entry per dataset, one binary entry per column
+            cursor = store.execute("INSERT INTO datasets (name, casename, source, size, mtime, offset, pending, rows, quants) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                   (dataset.getname(), casename(dataset.getname()), source, position["size"], mtime, position["offset"], position["pending"], len(data), json.dumps(dataset.getquants())))
+            store.executemany("INSERT OR IGNORE INTO columns VALUES (?, ?, ?, ?, ?)",
+                              [(cursor.lastrowid, name, dataset.getquants().index(name), data.dtype.str, np.ascontiguousarray(data[:, i]).tobytes()) for i, name in enumerate(dataset.getloaded())])
+            added += 1
+
+        store.executemany("INSERT OR REPLACE INTO quantities VALUES (?, ?, ?, ?, ?)",
+                          [(quant.getname(), quant.gettype(), quant.getdescr(), quant.getoffset(), quant.getfactor()) for quant in quantities])
+    store.close()
+    return added
+
+
+# read datasets from result store, selected by case name, quantity and source file (None: all)
+# quantity is a name or list of names, datasets containing any of them are read with their stored x data columns
+# only the selected columns are loaded, further columns are read from the source file on access, returns list of datasets
+def readstore(storefile, case=None, quantity=None, source=None):
+    store = openstore(storefile)
+    query = "SELECT datasets.id, name, source, size, offset, pending, rows, datasets.quants, quantity, dtype, data FROM datasets JOIN columns ON columns.dataset = datasets.id"
+
+    # selection by indexed fields
+    conditions = []
+    values = []
+    if case is not None:
+        conditions.append("casename = ?")
+        values.append(case)
+    if source is not None:
+        conditions.append("source = ?")
+        values.append(os.path.abspath(source))
+    if quantity is not None:
+        names = [quantity] if isinstance(quantity, str) else list(quantity)
+        marks = ", ".join("?"*len(names))
+        conditions.append(f"datasets.id IN (SELECT dataset FROM columns WHERE quantity IN ({marks}))")
+        conditions.append(f"(quantity IN ({marks}) OR quantity IN (SELECT name FROM quantities WHERE type = 'xdata'))")
+        values += names + names
+    if len(conditions) > 0:
+        query += " WHERE " + " AND ".join(conditions)
+    query += " ORDER BY datasets.id, position"
+
+    # combine columns of each dataset, quantities of stores without stored quantities are taken from the columns
+    datasets = []
+    for id, entries in itertools.groupby(store.execute(query, values), key=lambda entry: entry[0]):
+        entries = list(entries)
+        id, name, source, size, offset, pending, rows, quants = entries[0][:8]
+        loaded = [entry[8] for entry in entries]
+        quants = json.loads(quants) if quants is not None else loaded
+        data = np.empty((rows, len(loaded)), dtype=entries[0][9])
+        for i, entry in enumerate(entries):
+            data[:, i] = np.frombuffer(entry[10], dtype=entry[9])
+        dataset = Dataset(name, quants, None, source, None)
+        dataset.setdata(data, {"size": size, "offset": offset, "pending": pending}, loaded)
+        datasets.append(dataset)
+
+    store.close()
+    return datasets
+
+
+# metadata of quantity stored with binary data
+def quantitymeta(quant):
+    return {"name": quant.getname(), "descr": quant.getdescr(), "offset": quant.getoffset(), "factor": quant.getfactor()}
+
+
+# write x and y data to compressed binary file (.npz, .h5, .parquet) with one typed column per quantity
+# quantity metadata is stored with the columns, data is written in blocks of exportrows
+def writebinary(filename, data):
+    columns = [(data.getxquant(), np.asarray(data.getxdata())), (data.getyquant(), np.asarray(data.getydata()))]
+    extension = os.path.splitext(filename)[1]
+
+    # numpy archive, metadata stored as json string
+    if extension == ".npz":
+        arrays = {quant.getname(): values for quant, values in columns}
+        arrays["metadata"] = np.array(json.dumps({"header": data.getheader(), "quantities": [quantitymeta(quant) for quant, values in columns]}))
+        np.savez_compressed(filename, **arrays)
+
+    # hdf5 file, metadata stored as attributes of datasets
+    elif extension == ".h5":
+        import h5py
+        with h5py.File(filename, "w") as file:
+            file.attrs["header"] = data.getheader()
+            for quant, values in columns:
+                column = file.create_dataset(quant.getname().replace("/", "_"), shape=(len(values),), maxshape=(None,), dtype=values.dtype, chunks=(exportrows,), compression="gzip")
+                for i in range(0, len(values), exportrows):
+                    column[i:i + exportrows] = values[i:i + exportrows]
+                column.attrs.update(quantitymeta(quant))
+
+    # parquet file, metadata stored as json string in schema fields, one row group per block
+    elif extension == ".parquet":
+        import pyarrow
+        import pyarrow.parquet
+        fields = [pyarrow.field(quant.getname(), pyarrow.from_numpy_dtype(values.dtype), metadata={"quantity": json.dumps(quantitymeta(quant))}) for quant, values in columns]
+        schema = pyarrow.schema(fields, metadata={"header": data.getheader()})
+        with pyarrow.parquet.ParquetWriter(filename, schema, compression="zstd") as writer:
+            for i in range(0, len(columns[0][1]), exportrows):
+                writer.write_table(pyarrow.table([values[i:i + exportrows] for quant, values in columns], schema=schema))
 
 
 # get minimum and maximum values from data
+# minimum and maximum are merged from the statistics of the datasets
 def getminmax(sets, datatype):
-    for i in range(len(sets)):
-        # first entry
-        if i == 0:
-            if datatype == "xdata":
-                data = sets[i].getxdata()
-            else:
-                data = sets[i].getydata()
-            
-            min = np.min(data)
-            max = np.max(data)
+    if datatype == "xdata":
+        stats = mergestatistics([data.getxstats() for data in sets])
+    else:
+        stats = mergestatistics([data.getystats() for data in sets])
+    return stats.getmin(), stats.getmax()
+
+
+# compute statistics of data, data longer than exportrows is reduced in blocks and merged
+def computestatistics(data):
+    data = np.asarray(data)
+    if len(data) == 0:
+        return Statistics(0, np.nan, np.nan, np.nan, 0.0, np.nan, np.nan)
+    if len(data) > exportrows:
+        return mergestatistics([computestatistics(data[i:i + exportrows]) for i in range(0, len(data), exportrows)])
+    mean = np.mean(data, dtype=np.float64)
+    return Statistics(len(data), np.min(data), np.max(data), mean, np.sum((data - mean)**2), data[0], data[-1])
+
+
+# merge statistics of consecutive parts of data, first and last values are taken from first and last part
+def mergestatistics(statslist):
+    statslist = [stats for stats in statslist if stats.getcount() > 0]
+    if len(statslist) == 0:
+        return computestatistics([])
+
+    merged = statslist[0]
+    for stats in statslist[1:]:
+        count = merged.getcount() + stats.getcount()
+        delta = stats.getmean() - merged.getmean()
+        mean = merged.getmean() + delta*stats.getcount()/count
+        m2 = merged.getm2() + stats.getm2() + delta**2*merged.getcount()*stats.getcount()/count
+        merged = Statistics(count, min(merged.getmin(), stats.getmin()), max(merged.getmax(), stats.getmax()), mean, m2, merged.getfirst(), stats.getlast())
+    return merged
+
+
+# detect settling of y data, rolling averages of convwindow points are compared to the settled value (average of last window)
+# the series settles at the first window after which all averages stay within convtol of the settled value
+# the tolerance is relative to the settled value or to the range of the series if larger, so series approaching zero can settle
+# returns convergence (settled for more than one window), settled value and x value at end of first settled window
+def convergence(xdata, ydata):
+    xdata = np.asarray(xdata)
+    ydata = np.asarray(ydata, dtype=np.float64)
+    window = max(min(convwindow, len(ydata)), 1)
+    if len(ydata) == 0:
+        return False, np.nan, np.nan
+
+    # rolling averages from cumulative sums
+    sums = np.cumsum(np.insert(ydata, 0, 0.0))
+    averages = (sums[window:] - sums[:-window])/window
+    final = averages[-1]
+
+    # last rolling average outside of tolerance
+    tolerance = convtol*max(abs(final), np.ptp(ydata))
+    outside = np.flatnonzero(np.abs(averages - final) > tolerance)
+    settled = outside[-1] + 1 if len(outside) > 0 else 0
+    converged = len(averages) - settled > window
+    return converged, final, xdata[settled + window - 1]
+
+
+# write convergence of y data of xy datasets to table, one line per xy dataset, returns number of converged xy datasets
+def writeconvergence(filename, xydata):
+    lines = ["header\tquantity\tconverged\tvalue\txquantity\tsettled\n"]
+    rowformat = numberformat() + "\t%s\t" + numberformat() + "\n"
+    count = 0
+    for data in xydata:
+        converged, value, settled = convergence(data.getxdata(), data.getydata())
+        count += converged
+        lines.append(f"{data.getheader()}\t{data.getyquant().getname()}\t{'yes' if converged else 'no'}\t" + rowformat % (float(value), data.getxquant().getname(), float(settled)))
+
+    with open(filename, "w") as file:
+        file.writelines(lines)
+        file.close()
+    return count
 
-        # further entries
+
+# common x grid of xy datasets, resamplepoints equidistant points covering the x data of all datasets
+def resamplegrid(sets):
+    stats = mergestatistics([data.getxstats() for data in sets])
+    return np.linspace(stats.getmin(), stats.getmax(), resamplepoints)
+
+
+# interpolate y data of xy datasets onto common x grid, values outside of the x data of a dataset are nan
+# returns array with one row per dataset and one column per grid point
+def resample(sets, grid, method):
+    grid = np.asarray(grid, dtype=np.float64)
+    values = np.full((len(sets), len(grid)), np.nan)
+
+    for i, data in enumerate(sets):
+        xdata = np.asarray(data.getxdata())
+        ydata = np.asarray(data.getydata())
+        if len(xdata) == 0:
+            continue
+
+        # x data has to be ascending
+        if np.any(np.diff(xdata) < 0):
+            order = np.argsort(xdata, kind="stable")
+            xdata = xdata[order]
+            ydata = ydata[order]
+
+        # linear interpolation between neighbouring points
+        if method == "linear":
+            values[i] = np.interp(grid, xdata, ydata, left=np.nan, right=np.nan)
+
+        # zero-order hold, last value at or before grid point
         else:
-            if datatype == "xdata":
-                data = sets[i].getxdata()
-            else:
-                data = sets[i].getydata()
+            indices = np.searchsorted(xdata, grid, side="right") - 1
+            inside = (indices >= 0) & (grid <= xdata[-1])
+            values[i, inside] = ydata[indices[inside]]
 
-            if min > np.min(data):
-                min = np.min(data)
-            if max < np.max(data):
-                max = np.max(data)
-    return min, max
+    return values
 
 
-# set minimum and maximum values 
-def setminmax(descr, min, max):
+# write resampled y data of xy datasets to table, one column for x grid and one column per dataset
+def writeresampled(filename, sets, grid, values):
+    delimiter = "\t"
+    header = [f"{sets[0].getxquant().getname()}{delimiter}" + delimiter.join([data.getheader() for data in sets]) + "\n"]
+    rowformat = delimiter.replace("%", "%%").join([numberformat()]*(len(sets) + 1))
+    table = np.column_stack([grid, values.T])
+
+    with open(filename, "w", buffering=1048576) as file:
+        file.writelines(header)
+        for i in range(0, len(table), exportrows):
+            block = table[i:i + exportrows]
+            file.write("\n".join([rowformat]*len(block)) % tuple(block.ravel().tolist()) + "\n")
+        file.close()
+
+
+# write statistics of x and y data of xy datasets to table, one line per xy dataset and data type
+def writestatistics(filename, xydata):
+    lines = ["header\ttype\tquantity\tcount\tmin\tmax\tmean\tstd\tfirst\tlast\n"]
+    rowformat = "\t".join([numberformat()]*6) + "\n"
+    for data in xydata:
+        for type, quant, stats in (("xdata", data.getxquant(), data.getxstats()), ("ydata", data.getyquant(), data.getystats())):
+            values = (stats.getmin(), stats.getmax(), stats.getmean(), stats.getstd(), stats.getfirst(), stats.getlast())
+            lines.append(f"{data.getheader()}\t{type}\t{quant.getname()}\t{stats.getcount()}\t" + rowformat % tuple(float(value) for value in values))
+
+    with open(filename, "w") as file:
+        file.writelines(lines)
+        file.close()
+
+
+# set minimum and maximum values, answers are stored as key + "min" and key + "max"
+def setminmax(key, descr, min, max):
     while True:
         # min
         while True:
-            q_min = input(f"Enter minimum value of quantity '{descr}':\n>>> ({min}) ")
+            q_min = answer(f"{key}min", f"Enter minimum value of quantity '{descr}':\n>>> ({min}) ", "")
 
             try:
                 min = float(q_min)
@@ -182,11 +1287,11 @@ def setminmax(descr, min, max):
             except ValueError:
                 if q_min == "":
                     break
-                print(f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter a valid number.\n")
+                invalid(f"{key}min", f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter a valid number.\n")
 
         # max
         while True:
-            q_max = input(f"Enter maximum value of quantity '{descr}':\n>>> ({max}) ")
+            q_max = answer(f"{key}max", f"Enter maximum value of quantity '{descr}':\n>>> ({max}) ", "")
 
             try:
                 max = float(q_max)
@@ -195,17 +1300,144 @@ def setminmax(descr, min, max):
             except ValueError:
                 if q_max == "":
                     break
-                print(f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter a valid number.\n")
+                invalid(f"{key}max", f"{Fore.RED}Invalid input.{Style.RESET_ALL} Please enter a valid number.\n")
 
         if min < max:
             break
         else:
-            print(f"{Fore.RED}Invalid choice of values.{Style.RESET_ALL} Minimum '{min}' must be smaller than maximum '{max}'.\n")
+            invalid(f"{key}max", f"{Fore.RED}Invalid choice of values.{Style.RESET_ALL} Minimum '{min}' must be smaller than maximum '{max}'.\n")
+            answers.pop(f"{key}min", None)
     return min, max                    
 
 
-# create plot
+# reduce x and y data of lineplot to points distinguishable in figure, x data must be ascending
+# returns reduced x and y data, data is returned unchanged if it does not exceed the point budget
+def decimate(xdata, ydata, xmin, xmax):
+    xdata = np.asarray(xdata)
+    ydata = np.asarray(ydata)
+    pixels = int(figxsize*resolution)
+
+    # first, last, minimum and maximum point per pixel column, keeping all peaks and troughs
+    if decimation == "minmax" and len(xdata) > 4*pixels and xmax > xmin and np.all(np.diff(xdata) >= 0):
+        # pixel column of points, points outside of axis range are collected in an additional column on each side
+        columns = np.clip(np.floor((xdata - xmin)/(xmax - xmin)*pixels), -1, pixels).astype(np.int64)
+        starts = np.flatnonzero(np.diff(columns, prepend=columns[0] - 1))
+        ends = np.append(starts[1:], len(xdata)) - 1
+
+        # sort points by y value within columns
+        order = np.lexsort((ydata, columns))
+        keep = np.unique(np.concatenate((starts, ends, order[starts], order[ends])))
+        return xdata[keep], ydata[keep]
+
+    # largest triangle three buckets with two points per pixel column
+    elif decimation == "lttb" and len(xdata) > 2*pixels and np.all(np.diff(xdata) >= 0):
+        return lttb(xdata, ydata, 2*pixels)
+
+    return xdata, ydata
+
+
+# largest triangle three buckets downsampling to count points, first and last point are kept
+# each bucket keeps the point forming the largest triangle with the previous kept point and the average of the next bucket
+def lttb(xdata, ydata, count):
+    edges = np.linspace(1, len(xdata) - 1, count - 1).astype(np.int64)
+    sizes = np.diff(edges)
+
+    # averages of buckets, the last point serves as average after the last bucket
+    xmean = np.append(np.add.reduceat(xdata[:-1], edges[:-1])/sizes, xdata[-1])
+    ymean = np.append(np.add.reduceat(ydata[:-1], edges[:-1])/sizes, ydata[-1])
+
+    keep = np.empty(count, dtype=np.int64)
+    keep[0] = 0
+    keep[-1] = len(xdata) - 1
+    for i in range(count - 2):
+        start, stop = edges[i], edges[i + 1]
+        xa, ya = xdata[keep[i]], ydata[keep[i]]
+        area = np.abs((xa - xmean[i + 1])*(ydata[start:stop] - ya) - (xa - xdata[start:stop])*(ymean[i + 1] - ya))
+        keep[i + 1] = start + np.argmax(area)
+
+    return xdata[keep], ydata[keep]
+
+
+# create plot, returns filename and rendering time
 def createplot(plot):
+    record = beginrecord(currentstage(), plot.getname() + ".png")
+    start = time.perf_counter()
+    if reusefigure:
+        filename = drawtemplate(plot)
+    else:
+        filename = drawfigure(plot)
+    endrecord(record, datasets=len(plot.getxdata()), points=sum(len(xdata) for xdata in plot.getxdata()))
+    return filename, time.perf_counter() - start
+
+
+# draw plot in template figure, only data, labels, ranges and legend are replaced, returns filename
+def drawtemplate(plot):
+    # create template figure with settings shared by all plots
+    if len(template) == 0:
+        figure = Figure(figsize=(figxsize, figysize))
+        axes = figure.add_subplot()
+        axes.tick_params(labelsize = axisfontsize)
+        axes.grid(True)
+        template["figure"] = figure
+        template["axes"] = axes
+    figure = template["figure"]
+    axes = template["axes"]
+
+    # remove data and legend of previous plot
+    for artist in list(axes.lines) + list(axes.collections):
+        artist.remove()
+    if axes.get_legend() is not None:
+        axes.get_legend().remove()
+
+    # data, colors follow the default color cycle for each plot
+    xdatasets = plot.getxdata()
+    ydatasets = plot.getydata()
+    legend = plot.getlegend()
+    colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+    colors = [colors[i % len(colors)] for i in range(len(xdatasets))]
+
+    # pointplot
+    if plottype == "scatter":
+        for i in range(len(xdatasets)):
+            axes.scatter(xdatasets[i], ydatasets[i], color = colors[i], label = legend[i])
+        handles = axes.collections
+    # lineplot, all datasets drawn as single collection
+    else:
+        segments = [np.column_stack(decimate(xdatasets[i], ydatasets[i], plot.getxmin(), plot.getxmax())) for i in range(len(xdatasets))]
+        axes.add_collection(LineCollection(segments, colors = colors, linewidths = linesize, capstyle = "projecting", joinstyle = "round", zorder = 2))
+
+        # legend entries, the invisible collection of open paths is not drawn but lets the legend avoid the data as with one line per dataset
+        if len(xdatasets) > 1:
+            handles = [Line2D([], [], color = colors[i], linewidth = linesize) for i in range(len(xdatasets))]
+            axes.add_collection(PolyCollection(segments, closed = False, visible = False), autolim = False)
+
+    # title
+    title = plot.gettitle()
+    if not title == "":
+        axes.set_title(title + "\n", fontsize = titlefontsize)
+    else:
+        axes.set_title("")
+
+    # labels
+    axes.set_xlabel(plot.getxlabel(), fontsize = labelfontsize)
+    axes.set_ylabel(plot.getylabel() + "\n", fontsize = labelfontsize)
+
+    # axis ranges
+    axes.set_xlim(plot.getxmin(), plot.getxmax())
+    axes.set_ylim(plot.getymin(), plot.getymax())
+
+    # legend
+    if len(xdatasets) > 1:
+        axes.legend(handles, legend, fontsize = legendfontsize)
+
+    # save to file
+    filename = plot.getname() + ".png"
+    figure.savefig(filename, dpi=resolution)
+    return filename
+
+
+# draw plot in new figure with one line per dataset, returns filename
+def drawfigure(plot):
     plt.figure(figsize=(figxsize, figysize))
 
     # data
@@ -220,7 +1452,8 @@ def createplot(plot):
     # lineplot
     else:
         for i in range(len(xdatasets)):
-            plt.plot(xdatasets[i], ydatasets[i], label = legend[i], linewidth = linesize)
+            xdata, ydata = decimate(xdatasets[i], ydatasets[i], plot.getxmin(), plot.getxmax())
+            plt.plot(xdata, ydata, label = legend[i], linewidth = linesize)
 
     # title
     title = plot.gettitle()
@@ -250,34 +1483,300 @@ def createplot(plot):
     filename = plot.getname() + ".png"
     plt.savefig(filename, dpi=resolution)
     plt.close()
-    print(f"Created plot '{filename}'")
+    return filename
+
+
+# select non-interactive backend in worker processes
+def initplotworker():
+    plt.switch_backend("Agg")
+
 
+# create plots, using a pool of worker processes if enabled
+def createplots(plots):
+    count = plotworkers if plotworkers > 0 else os.cpu_count()
+    count = min(count, len(plots))
+    start = time.perf_counter()
+
+    # create in current process
+    if count <= 1:
+        results = [createplot(plot) for plot in plots]
+
+    # create with pool of worker processes, results are returned in order of plots
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=count, initializer=initplotworker) as pool:
+            results = list(pool.map(createplot, plots))
+        for plot, (filename, elapsed) in zip(plots, results):
+            addrecord(currentstage(), filename, elapsed, datasets=len(plot.getxdata()), points=sum(len(xdata) for xdata in plot.getxdata()))
+
+    for filename, elapsed in results:
+        print(f"Created plot '{filename}' in {elapsed:.2f} s")
+    print(f"Created {len(results)} plot(s) in {time.perf_counter() - start:.2f} s using {max(count, 1)} process(es).")
+
+
+
+# peak resident memory of process in bytes, None if not available (e.g. on windows)
+def peakrss():
+    try:
+        import resource
+    except ImportError:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss*1024
+
+
+# cpu time of process and finished worker processes in s
+def cputime():
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+# name of current stage, None if no stage is recorded
+def currentstage():
+    stages = [record for record in openrecords if record["item"] is None]
+    return stages[-1]["stage"] if len(stages) > 0 else None
+
+
+# begin record of stage or of item (file or plot) in stage, returns record or None if profiling is disabled
+# stages named by profilestage are profiled with cProfile
+def beginrecord(stage, item):
+    if not profiling:
+        return None
+
+    # peak memory is traced per record, the peak of the enclosing record is kept before resetting
+    if tracemalloc.is_tracing():
+        if len(openrecords) > 0:
+            openrecords[-1]["peak"] = max(openrecords[-1]["peak"], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+
+    record = {"stage": stage, "item": item, "begin": time.perf_counter(), "wall": None, "cpu": cputime(), "peak": 0, "rss": None, "counts": {}, "profile": None}
+    if item is None and stage.lower() == profilestage.lower():
+        record["profile"] = cProfile.Profile()
+        record["profile"].enable()
+    openrecords.append(record)
+    return record
+
+
+# end record, counts (e.g. files, rows, plots) are added to record
+def endrecord(record, **counts):
+    if record is None:
+        return
+    record["wall"] = time.perf_counter() - record["begin"]
+    record["cpu"] = cputime() - record["cpu"]
+    record["counts"].update(counts)
+
+    # peak memory of record is included in peak of enclosing record
+    openrecords.remove(record)
+    if tracemalloc.is_tracing():
+        record["peak"] = max(record["peak"], tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+        if len(openrecords) > 0:
+            openrecords[-1]["peak"] = max(openrecords[-1]["peak"], record["peak"])
+    record["rss"] = peakrss()
+
+    # profile statistics are written to file named after stage
+    if record["profile"] is not None:
+        record["profile"].disable()
+        filename = os.path.join(sourcedir, "profile-" + re.sub(r"\W+", "-", record["stage"].lower()) + ".prof")
+        record["profile"].dump_stats(filename)
+        record["profile"] = filename
+    records.append(record)
+
+
+# end current stage and begin next stage of name (None: no next stage)
+def nextstage(name):
+    for record in [record for record in openrecords if record["item"] is None]:
+        endrecord(record)
+    if name is not None:
+        beginrecord(name, None)
+
+
+# add counts to current stage
+def countstage(**counts):
+    stages = [record for record in openrecords if record["item"] is None]
+    if len(stages) > 0:
+        stages[-1]["counts"].update(counts)
+
+
+# add record of item timed in worker process, only wall time is known
+def addrecord(stage, item, wall, **counts):
+    if profiling:
+        records.append({"stage": stage, "item": item, "begin": None, "wall": wall, "cpu": None, "peak": None, "rss": None, "counts": counts, "profile": None})
+
+
+# print summary table of stages and slowest items
+def printprofile():
+    stages = [record for record in records if record["item"] is None]
+    items = sorted([record for record in records if record["item"] is not None], key=lambda record: -record["wall"])
+    megabytes = lambda value: "-" if value is None else f"{value/2**20:.1f}"
+
+    print(f"{Style.BRIGHT}\nProfile of run:{Style.RESET_ALL}")
+    print(f"{'stage':<24}{'wall [s]':>10}{'cpu [s]':>10}{'peak [MB]':>11}{'rss [MB]':>10}   counts")
+    for record in stages:
+        counts = " ".join(f"{key}={value}" for key, value in record["counts"].items())
+        print(f"{record['stage']:<24}{record['wall']:>10.3f}{record['cpu']:>10.3f}{megabytes(record['peak']):>11}{megabytes(record['rss']):>10}   {counts}")
+
+    if len(items) > 0:
+        print(f"\nSlowest of {len(items)} recorded file(s) and plot(s):")
+        for record in items[:5]:
+            print(f"- {record['item']} ({record['stage']}): {record['wall']:.3f} s")
+
+    for record in stages:
+        if record["profile"] is not None:
+            print(f"\nProfile of stage {record['stage']} written to '{os.path.relpath(record['profile'], sourcedir)}', view with 'python -m pstats {os.path.basename(record['profile'])}'.")
+
+
+# write records to trace file in trace event format, viewable in chrome://tracing or Perfetto
+def writetrace(filename):
+    origin = min([record["begin"] for record in records if record["begin"] is not None], default=0.0)
+    events = []
+    for record in records:
+        args = {"cpu": record["cpu"], "peak": record["peak"], "rss": record["rss"]}
+        args.update(record["counts"])
+        event = {"name": record["stage"] if record["item"] is None else record["item"], "cat": "stage" if record["item"] is None else record["stage"], "ph": "X", "pid": os.getpid(), "tid": 0, "dur": record["wall"]*1e6, "args": args}
+        if record["begin"] is not None:
+            event["ts"] = (record["begin"] - origin)*1e6
+        else:
+            event["ph"] = "i"
+            event["s"] = "p"
+            event["ts"] = 0.0
+        events.append(event)
+
+    with open(filename, "w") as file:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
+        file.close()
+
+
+# end recorded stages, print summary and write trace file
+def reportprofile():
+    if not profiling:
+        return
+    nextstage(None)
+    printprofile()
+    if tracefile != "":
+        try:
+            writetrace(os.path.join(sourcedir, tracefile))
+            print(f"\nTrace written to '{tracefile}'.")
+        except OSError as error:
+            print(f"{Fore.RED}Could not write trace file '{tracefile}': {error}{Style.RESET_ALL}")
+
+
+# add data appended to datafiles to xy datasets, returns new x and y data of updated xy datasets
+def updatexydata(xydata):
+    updated = {}
+    results = {}
+
+    for data in xydata:
+        # read each datafile only once
+        dataset = data.getdataset()
+        if dataset not in results:
+            results[dataset] = followfile(dataset)
+            if results[dataset] is not None:
+                print(f"Read {len(results[dataset][0])} new row(s) from file {os.path.relpath(dataset.getsource(), sourcedir)}")
+
+        if results[dataset] is None:
+            continue
+        rows, drop = results[dataset]
+        if len(rows) == 0:
+            continue
+
+        # format and scale new data
+        positions = registry.getcolumns(dataset)
+        columns = scalecolumns({name: rows[:, positions[name]] for name in positions}, [data.getxquant(), data.getyquant()])
+        xdata = columns[data.getxquant().getname()]
+        ydata = columns[data.getyquant().getname()]
+
+        data.extend(xdata, ydata, drop)
+        updated[data] = (xdata, ydata)
+    return updated
     
 
 ################################################################ CLASS DEFINITION ###############################################################
 # dataset class definition
 class Dataset:
+    # attributes are kept in slots instead of a dictionary per instance
+    __slots__ = ("name", "quants", "data", "loaded", "source", "position", "buffer")
+
     # dataset constructor
-    def __init__(self, name, quants, data):
+    def __init__(self, name, quants, data, source, position):
         self.name = name                # name of file
         self.quants = quants            # quantities found in file
-        self.data = data                # dataset found in file
-
-    # dataset destructor
-    def __del__(self):
-        pass
+        self.data = data                # data array of loaded columns (None: not loaded yet)
+        self.loaded = list(quants) if data is not None else []  # quantities of loaded columns, in order of data columns
+        self.source = source            # path of file
+        self.position = position        # read position in file (size read, offset after last complete line, pending rows after offset)
+        self.buffer = None              # preallocated storage for appending data
 
     # getter functions
     def getname(self):
         return self.name
     def getquants(self):
         return self.quants
-    def getdata(self):
+    def getdata(self):                  # data of all quantities, missing columns are loaded
+        self.load(self.quants)
+        return self.data
+    def getcolumn(self, name):          # data of quantity, loaded on first access
+        self.load([name])
+        return self.data[:, self.loaded.index(name)]
+    def getloaded(self):
+        return self.loaded
+    def getarray(self):                 # data array of loaded columns, without loading further columns
         return self.data
+    def getrows(self):                  # number of loaded rows
+        return 0 if self.data is None else len(self.data)
+    def getsource(self):
+        return self.source
+    def getposition(self):
+        return self.position
+
+    # setter functions
+    def setposition(self, position):    # set read position in file
+        self.position = position
+    def setdata(self, data, position, loaded):  # set data of loaded columns and read position
+        self.data = data
+        self.position = position
+        self.loaded = loaded
+        self.buffer = None
+    def load(self, names):              # load columns of quantities in names if missing, from cache if available
+        if all(name in self.loaded for name in names):
+            return
+        names = [name for name in self.quants if name in names or name in self.loaded]
+
+        # first load, data is read up to the end of the file
+        if self.position is None:
+            entry = loadcache(self.source, names)
+            if entry is None:
+                entry = readdatafile(self.source, names)
+            quants, data, position, loaded = entry
+            if len(quants) == 0:
+                data, position, loaded = np.empty((0, len(names)), dtype=floattype), self.position, names
+            self.setdata(data, position, loaded)
+            return
+
+        # further columns are read up to the current read position, which is kept, data appended later is read when following
+        usecols = [self.quants.index(name) for name in names if name not in self.loaded]
+        quants, offset = readheader(self.source)
+        columns, end, pending = readrange(self.source, offset, self.position["size"], len(self.quants), usecols)
+        if quants != self.quants or columns is None or len(columns) != len(self.data):
+            raise OSError(f"file {self.source} has changed since it was read")
+        data = np.empty((len(self.data), len(names)), dtype=floattype)
+        for i, name in enumerate(names):
+            if name in self.loaded:
+                data[:, i] = self.data[:, self.loaded.index(name)]
+            else:
+                data[:, i] = columns[:, usecols.index(self.quants.index(name))]
+        self.data = data
+        self.loaded = names
+        self.buffer = None
+    def extend(self, rows, drop):       # replace last drop rows by new rows, rows contain all quantities
+        if self.loaded != self.quants:
+            rows = rows[:, [self.quants.index(name) for name in self.loaded]]
+        self.buffer, self.data = growarray(self.buffer, self.data, rows, drop)
     
 
 # quantitiy class definition
 class Quantity:
+    __slots__ = ("name", "count", "type", "descr", "offset", "factor")
+
     # quantity constructor
     def __init__(self, name, type, descr, offset, factor):
         self.name = name                # quantity name
@@ -287,10 +1786,6 @@ class Quantity:
         self.offset = float(offset)     # absolute offset of quantity
         self.factor = float(factor)     # scaling factor for variable
 
-    # quantity destructor
-    def __del__(self):
-        pass
-
     # getter functions
     def getname(self):
         return self.name
@@ -325,19 +1820,57 @@ class Quantity:
         self.factor = float(factor)
 
 
+# quantity registry class definition
+class Registry:
+    __slots__ = ("quantities", "columns")
+
+    # registry constructor
+    def __init__(self):
+        self.quantities = {}            # quantities by name, in order of first occurrence
+        self.columns = {}               # column positions of quantities by dataset
+
+    # getter functions
+    def getquantities(self):            # list of all quantities
+        return list(self.quantities.values())
+    def getquantity(self, name):        # quantity of name, None if not included
+        return self.quantities.get(name)
+    def getcolumns(self, dataset):      # column positions of quantities in dataset
+        return self.columns[dataset]
+    def gettyped(self, names, type):    # quantities of given type out of names
+        return [self.quantities[name] for name in names if name in self.quantities and self.quantities[name].gettype() == type]
+    def getcount(self):                 # number of quantities
+        return len(self.quantities)
+
+    # setter functions
+    def addquantity(self, quant):       # add quantity, first entry of a name is kept
+        if quant.getname() not in self.quantities:
+            self.quantities[quant.getname()] = quant
+    def adddataset(self, dataset):      # add quantities of dataset, incrementing counts of included quantities
+        self.columns[dataset] = {}
+        for i, name in enumerate(dataset.getquants()):
+            if name in self.quantities:
+                self.quantities[name].addcount()
+            else:
+                self.quantities[name] = Quantity(name, None, None, 0.0, 1.0)
+            self.columns[dataset].setdefault(name, i)
+
+
 # xydata class definition
 class XYdata:
+    __slots__ = ("header", "xquant", "yquant", "xdata", "ydata", "dataset", "xbuffer", "ybuffer", "xstats", "ystats")
+
     # xydata constructor
-    def __init__(self, header, xquant, yquant, xdata, ydata):
+    def __init__(self, header, xquant, yquant, xdata, ydata, dataset):
         self.header = header            # header of xydata
         self.xquant = xquant            # x quantity of data
         self.yquant = yquant            # y quantity of data
-        self.xdata = xdata              # x data
-        self.ydata = ydata              # y data
-
-    # xydata destructor
-    def __del__(self):
-        pass
+        self.xdata = xdata              # read-only x data, might be shared with other xy datasets
+        self.ydata = ydata              # read-only y data
+        self.dataset = dataset          # dataset containing raw data
+        self.xbuffer = None             # preallocated storage for appending x data
+        self.ybuffer = None             # preallocated storage for appending y data
+        self.xstats = computestatistics(xdata)  # statistics of x data
+        self.ystats = computestatistics(ydata)  # statistics of y data
 
     # getter functions
     def getheader(self):
@@ -350,27 +1883,103 @@ class XYdata:
         return self.xdata
     def getydata(self):
         return self.ydata
+    def getdataset(self):
+        return self.dataset
+    def getxstats(self):
+        return self.xstats
+    def getystats(self):
+        return self.ystats
+
+    # setter functions
+    def extend(self, xdata, ydata, drop):   # replace last drop values by new values, statistics are merged or recomputed if values are replaced
+        self.xbuffer, grown = growarray(self.xbuffer, self.xdata, xdata, drop)
+        self.xdata = readonly(grown)
+        self.ybuffer, grown = growarray(self.ybuffer, self.ydata, ydata, drop)
+        self.ydata = readonly(grown)
+        if drop > 0:
+            self.xstats = computestatistics(self.xdata)
+            self.ystats = computestatistics(self.ydata)
+        else:
+            self.xstats = mergestatistics([self.xstats, computestatistics(xdata)])
+            self.ystats = mergestatistics([self.ystats, computestatistics(ydata)])
     
 
+# statistics class definition
+class Statistics:
+    __slots__ = ("count", "min", "max", "mean", "m2", "first", "last")
+
+    # statistics constructor
+    def __init__(self, count, min, max, mean, m2, first, last):
+        self.count = count              # number of values
+        self.min = min                  # minimum value
+        self.max = max                  # maximum value
+        self.mean = mean                # mean value
+        self.m2 = m2                    # sum of squared deviations from mean
+        self.first = first              # first value
+        self.last = last                # last value
+
+    # getter functions
+    def getcount(self):
+        return self.count
+    def getmin(self):
+        return self.min
+    def getmax(self):
+        return self.max
+    def getmean(self):
+        return self.mean
+    def getm2(self):
+        return self.m2
+    def getstd(self):                   # population standard deviation
+        if self.count == 0:
+            return np.nan
+        return np.sqrt(self.m2/self.count)
+    def getfirst(self):
+        return self.first
+    def getlast(self):
+        return self.last
+
+
+# grouping class definition
+class Grouping:
+    __slots__ = ("quantities", "positions")
+
+    # grouping constructor, xy datasets are indexed in a single pass, descriptions are compared by key
+    def __init__(self, xydata):
+        self.quantities = {}            # xy datasets by names of x and y quantity, in order of first occurrence
+        self.positions = {}             # position of xy datasets in list by header
+        for i, data in enumerate(xydata):
+            self.quantities.setdefault(self.quantkey(data), []).append(data)
+            self.positions.setdefault(data.getheader(), i)
+
+    # getter functions
+    def quantkey(self, data):           # key of xy dataset by quantity names
+        return (data.getxquant().getname(), data.getyquant().getname())
+    def descrkey(self, data):           # key of xy dataset by quantity descriptions
+        return (data.getxquant().getdescr(), data.getyquant().getdescr())
+    def getgroups(self):                # lists of xy datasets with matching quantities
+        return list(self.quantities.values())
+    def getposition(self, header):      # position of xy dataset in list, None if not included
+        return self.positions.get(header)
+
+
 # plot class definition
 class Plot:
+    __slots__ = ("name", "title", "xlabel", "ylabel", "xdata", "ydata", "xmin", "xmax", "ymin", "ymax", "legend", "sets")
+
     # plot constructor
-    def __init__(self, name, title, xlabel, ylabel, xdata, ydata, xmin, xmax, ymin, ymax, legend):
+    def __init__(self, name, title, xlabel, ylabel, xdata, ydata, xmin, xmax, ymin, ymax, legend, sets):
         self.name = name            # name of plot for filename
         self.title = title          # plot title
         self.xlabel = xlabel        # x axis label
         self.ylabel = ylabel        # y axis label
-        self.xdata = xdata          # list of plot xdata
-        self.ydata = ydata          # list of plot ydata
+        self.xdata = xdata          # list of plot xdata, arrays are shared with xy datasets
+        self.ydata = ydata          # list of plot ydata, arrays are shared with xy datasets
         self.xmin = xmin            # minimum value on x axis
         self.xmax = xmax            # maximum value in x axis
         self.ymin = ymin            # minimum value on y axis
         self.ymax = ymax            # maximum value in y axis
         self.legend = legend        # legend list
-
-    # surface destructor
-    def __del__(self):
-        pass
+        self.sets = sets            # list of plotted xy datasets
 
     # getter functions
     def getname(self):
@@ -395,792 +2004,1034 @@ class Plot:
         return self.ymax
     def getlegend(self):
         return self.legend
+    def getsets(self):
+        return self.sets
+
+    # worker processes only need the plot data, not the xy datasets
+    def __getstate__(self):
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state["sets"] = None
+        return state
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    # setter functions
+    def setdata(self, xdata, ydata):                # set lists of plot data
+        self.xdata = xdata
+        self.ydata = ydata
+    def setranges(self, xmin, xmax, ymin, ymax):    # set axis ranges
+        self.xmin = xmin
+        self.xmax = xmax
+        self.ymin = ymin
+        self.ymax = ymax
     
 
 
-################################################################# COLLECT FILES #################################################################
-outfiles = []
+# run pipeline only when executed as a script, worker processes only import the definitions above
+if __name__ == "__main__":
+    # command line arguments
+    parser = argparse.ArgumentParser(description="Extract data from Ansys Fluent .out files, write it to files and create plots.")
+    parser.add_argument("-c", "--config", help="configuration file (.json, .toml, .yaml) with answers to queries, remaining queries are asked interactively")
+    parser.add_argument("-b", "--batch", action="store_true", help="run without queries, unanswered queries use their defaults")
+    parser.add_argument("-r", "--record", help="write answers of this session to a replayable configuration file (.json, .toml, .yaml)")
+    parser.add_argument("-s", "--set", action="append", default=[], metavar="KEY=VALUE", help="answer to a query, overrides the configuration file")
+    parser.add_argument("--files", nargs="+", metavar="FILE", help="names or numbers of datafiles to be processed")
+    parser.add_argument("--workers", type=int, help="number of worker processes for reading datafiles")
+    parser.add_argument("--plotworkers", type=int, help="number of worker processes for creating plots")
+    parser.add_argument("--clear-cache", action="store_true", help="clear cache before processing datafiles")
+    parser.add_argument("--profile", action="store_true", help="record time, memory and counts of stages, files and plots and print a summary at the end of the run")
+    parser.add_argument("--trace", metavar="FILE", help="write recorded stages, files and plots to a JSON trace file, implies --profile")
+    parser.add_argument("--profile-stage", metavar="STAGE", help="profile a stage with cProfile, e.g. \"DATA PROCESSING\", implies --profile")
+    parser.add_argument("--import-references", metavar="FILE", help="add or update quantities of a reference file to the reference file of the script and exit")
+    parser.add_argument("--export-references", metavar="FILE", help="write valid quantities of the reference file of the script to a reference file and exit")
+    parser.add_argument("--read-store", nargs="*", metavar="FIELD=VALUE", help="list datasets of the result store selected by case, quantity (repeatable) and source, e.g. case=S108-8 quantity=v-frac-water, and exit")
+    args = parser.parse_args()
+
+    # answers from configuration file
+    if args.config is not None:
+        try:
+            answers.update(readconfig(args.config))
+        except Exception as error:
+            print(f"{Fore.RED}Could not read configuration file '{args.config}': {error}{Style.RESET_ALL}")
+            sys.exit(1)
+
+    # answers from command line, values are interpreted as json if possible, e.g. true, 1.5 or ["a", "b"]
+    for entry in args.set:
+        key, separator, value = entry.partition("=")
+        if separator == "":
+            parser.error(f"invalid answer '{entry}', expected KEY=VALUE")
+        try:
+            answers[key] = json.loads(value)
+        except ValueError:
+            answers[key] = value
+
+    if args.files is not None:
+        answers["files.all"] = False
+        answers["files.select"] = args.files
+
+    # settings from command line
+    batchmode = args.batch
+    if args.workers is not None:
+        workers = args.workers
+    if args.plotworkers is not None:
+        plotworkers = args.plotworkers
+    if args.clear_cache:
+        resetcache = True
+    if args.trace is not None:
+        tracefile = args.trace
+    if args.profile_stage is not None:
+        profilestage = args.profile_stage
+    profiling = profiling or args.profile or tracefile != "" or profilestage != ""
+
+    # import or export reference quantities
+    if args.import_references is not None or args.export_references is not None:
+        try:
+            if args.import_references is not None:
+                references = readreferences(args.import_references)
+                replaced, appended = writereferences(os.path.join(sourcedir, reffile), {quant.getname(): quant for quant in references.getquantities()})
+                print(f"Imported {appended} new and {replaced} updated quantities from '{args.import_references}' to '{reffile}'.")
+            if args.export_references is not None:
+                references = readreferences(os.path.join(sourcedir, reffile))
+                with open(args.export_references, "w") as file:
+                    file.writelines([quant.getref() + "\n" for quant in references.getquantities()])
+                    file.close()
+                print(f"Exported {references.getcount()} quantities from '{reffile}' to '{args.export_references}'.")
+        except OSError as error:
+            print(f"{Fore.RED}Could not transfer reference quantities: {error}{Style.RESET_ALL}")
+            sys.exit(1)
+        sys.exit()
 
+    # list datasets of result store
+    if args.read_store is not None:
+        selection = {}
+        for entry in args.read_store:
+            field, separator, value = entry.partition("=")
+            if separator == "" or field not in ("case", "quantity", "source"):
+                parser.error(f"invalid selection '{entry}', expected case=VALUE, quantity=VALUE or source=VALUE")
+            if field == "quantity":
+                selection.setdefault("quantity", []).append(value)
+            else:
+                selection[field] = value
+        try:
+            stored = readstore(os.path.join(sourcedir, storename), **selection)
+        except sqlite3.Error as error:
+            print(f"{Fore.RED}Could not read result store '{storename}': {error}{Style.RESET_ALL}")
+            sys.exit(1)
+        print(f"Found {len(stored)} dataset(s) in result store '{storename}':")
+        for dataset in stored:
+            data = dataset.getarray()
+            columns = ", ".join(f"{name} [{np.min(data[:, i]):g}, {np.max(data[:, i]):g}]" if len(data) > 0 else name for i, name in enumerate(dataset.getloaded()))
+            print(f"- {dataset.getname()}: {len(data)} row(s) of {dataset.getsource()}\n    - {columns}")
+        sys.exit()
 
-# first check for .out files in specified data directory
-if os.path.exists(datadir) and os.path.isdir(datadir):
-    # collect all outfiles
-    outfiles = [file for file in os.listdir(datadir) if file.endswith(".out")]
-    
-    # check if files were found
-    if len(outfiles) > 0:
-        print(f"Found {len(outfiles)} .out file(s) in the /{dataname} directory.")
-        currentdir = datadir
-    else:
-        print(f"{Fore.RED}No .out files found in the specified data directory /{dataname}.{Style.RESET_ALL}\nChecking current directory instead.")
-else:
-    print(f"{Fore.RED}The specified data directory /{dataname} does not exist in the current directory.{Style.RESET_ALL}\nChecking current directory instead.")
+    # record answers at exit, including early exits
+    if args.record is not None:
+        atexit.register(writeconfig, os.path.abspath(args.record), recorded)
 
+    # trace memory allocations of recorded stages
+    if profiling:
+        tracemalloc.start()
 
-# if no files were found in the specified date directory, check script source folder instead
-if len(outfiles) == 0:
-    # collect all outfiles
-    outfiles = [file for file in os.listdir(sourcedir) if file.endswith(".out")]
-    
-    #check if files were found
-    if len(outfiles) > 0:
-        currentdir = sourcedir
-        print(f"\nFound {len(outfiles)} .out file(s) in the current directory.")
+    print(f"{Style.BRIGHT}#################################################################### WELCOME ####################################################################{Style.RESET_ALL}")
+    # change to directory containing the script
+    os.chdir(sourcedir)
+
+
+
+    ################################################################# COLLECT FILES #################################################################
+    nextstage("COLLECT FILES")
+    outfiles = []
+
+
+    # first check for .out files in specified data directory
+    if os.path.exists(datadir) and os.path.isdir(datadir):
+        # collect all outfiles
+        outfiles, fields = findfiles(datadir)
+        
+        # check if files were found
+        if len(outfiles) > 0:
+            print(f"Found {len(outfiles)} .out file(s) in the /{dataname} directory.")
+            currentdir = datadir
+        else:
+            print(f"{Fore.RED}No .out files found in the specified data directory /{dataname}.{Style.RESET_ALL}\nChecking current directory instead.")
     else:
-        # exit program if no .out files were found 
-        print(f"{Fore.RED}\nNo .out files found in the current directory.{Style.RESET_ALL}\nPlease provide post processing files either in the current directory or in the specified data subfolder: /{dataname}.")
-        print(f"{Fore.RED}\n\nExiting program.{Style.RESET_ALL}")
-        sys.exit()
-    
+        print(f"{Fore.RED}The specified data directory /{dataname} does not exist in the current directory.{Style.RESET_ALL}\nChecking current directory instead.")
+
 
-# list all found outfiles  
-for i in range(len(outfiles)):
-    print(f"{i+1}: {outfiles[i]}")
+    # if no files were found in the specified date directory, check script source folder instead
+    if len(outfiles) == 0:
+        # collect all outfiles
+        outfiles, fields = findfiles(sourcedir)
+        
+        #check if files were found
+        if len(outfiles) > 0:
+            currentdir = sourcedir
+            print(f"\nFound {len(outfiles)} .out file(s) in the current directory.")
+        else:
+            # exit program if no .out files were found 
+            print(f"{Fore.RED}\nNo .out files found in the current directory.{Style.RESET_ALL}\nPlease provide post processing files either in the current directory or in the specified data subfolder: /{dataname}.")
+            print(f"{Fore.RED}\n\nExiting program.{Style.RESET_ALL}")
+            sys.exit(1)
+        
 
+    # list all found outfiles  
+    for i in range(len(outfiles)):
+        print(f"{i+1}: {outfiles[i]}")
+    countstage(files=len(outfiles))
 
 
-################################################################# FILE PROCESSING ################################################################
-print(f"{Style.BRIGHT}\n\n################################################################# FILE PROCESSING ################################################################{Style.RESET_ALL}")
-# change to directory with data
-os.chdir(currentdir)
 
+    ################################################################# FILE PROCESSING ################################################################
+    print(f"{Style.BRIGHT}\n\n################################################################# FILE PROCESSING ################################################################{Style.RESET_ALL}")
+    nextstage("FILE PROCESSING")
+    # change to directory with data
+    os.chdir(currentdir)
 
-# query to process all found files  
-q_all = ynquery("Automatically process all data files at once? (y/n):\n>>> ")
 
-# process all files at once
-if q_all:
-    files = outfiles
+    # query to process all found files  
+    q_all = ynquery("files.all", "Automatically process all data files at once? (y/n):\n>>> ", "files.select" not in answers)
 
-# process specific files
-else:
-    while True:
-        # get numbers of files
-        filenums = input("Enter the numbers of datafiles to be processed, separated by spaces:\n>>> ").strip().split()
-        files = []
+    # process all files at once
+    if q_all:
+        files = outfiles
 
-        print()
+    # process specific files
+    else:
+        # positions of files in list
+        positions = {file: i for i, file in enumerate(outfiles)}
 
-        # add valid files
-        for i in range(len(filenums)):
-            try:
-                entry = int(filenums[i])
+        while True:
+            # get numbers or names of files
+            filenums = answerlist("files.select", "Enter the numbers of datafiles to be processed, separated by spaces:\nNames, name patterns (e.g. S1*-contact-area.out) and field filters (e.g. case=1?? monitor=contact-area) are accepted as well.\n>>> ")
+            files = []
+            selected = set()
 
-                # number has to match outfile list entry
-                if entry <= len(outfiles):
-                    # add to empty list
-                    if len(files) == 0:
-                        files.append(outfiles[entry-1])
-                    
-                    # check for double entries
+            print()
+
+            # add files matching all field filters
+            filters = [entry.split("=", 1) for entry in filenums if "=" in entry]
+            if len(filters) > 0:
+                matches = [file for file in outfiles if all(fnmatch.fnmatchcase(str(fields[file].get(field, "")), pattern) for field, pattern in filters)]
+                if len(matches) == 0:
+                    print(f"Filter {Fore.RED}'{' '.join([entry for entry in filenums if '=' in entry])}'{Style.RESET_ALL} does not match any file.")
+                for file in matches:
+                    if file not in selected:
+                        files.append(file)
+                        selected.add(file)
+
+            # add valid files
+            for i in range(len(filenums)):
+                if "=" in filenums[i]:
+                    continue
+
+                # add files matching name pattern
+                if any(character in filenums[i] for character in "*?[") and filenums[i] not in positions:
+                    matches = [file for file in outfiles if matchglobs(file, [filenums[i]]) or fnmatch.fnmatch(os.path.basename(file), filenums[i])]
+                    if len(matches) == 0:
+                        print(f"Pattern {Fore.RED}'{filenums[i]}'{Style.RESET_ALL} does not match any file.")
+                    for file in matches:
+                        if file not in selected:
+                            files.append(file)
+                            selected.add(file)
+                    continue
+
+                try:
+                    # file names are accepted as well
+                    if filenums[i] in positions:
+                        entry = positions[filenums[i]] + 1
                     else:
-                        included = False
-                        
-                        for file in files:
-                            if file == outfiles[entry-1]:
-                                included = True
-                                print(f"Number {Fore.RED}'{filenums[i]}'{Style.RESET_ALL} has multiple entries. File added only once to current selection.")
-                                break
-                        
-                        if not included:
+                        entry = int(filenums[i])
+
+                    # number has to match outfile list entry
+                    if entry <= len(outfiles):
+                        # check for double entries
+                        if outfiles[entry-1] in selected:
+                            print(f"Number {Fore.RED}'{filenums[i]}'{Style.RESET_ALL} has multiple entries. File added only once to current selection.")
+                        else:
                             files.append(outfiles[entry-1])
+                            selected.add(outfiles[entry-1])
 
-                # number does not match list entries
-                else:
+                    # number does not match list entries
+                    else:
+                        print(f"Number {Fore.RED}'{filenums[i]}'{Style.RESET_ALL} is invalid.")    
+
+                # not a valid number, number conversion failed
+                except ValueError:
                     print(f"Number {Fore.RED}'{filenums[i]}'{Style.RESET_ALL} is invalid.")    
+            
+            if len(files) > 0:
+                # record names, numbers depend on the order of found files
+                recorded["files.select"] = files
+                break
+            invalid("files.select", f"{Fore.RED}No valid datafiles selected.{Style.RESET_ALL}")
 
-            # not a valid number, number conversion failed
-            except ValueError:
-                print(f"Number {Fore.RED}'{filenums[i]}'{Style.RESET_ALL} is invalid.")    
-        
-        if len(files) > 0:
-            break
 
+    # datasets including quantities collected from files
+    datasets = []
 
-# datasets including quantities collected from files
-datasets = []
+    # clear cache of previously processed files
+    if resetcache:
+        print(f"\nRemoved {clearcache()} entries from cache directory '{cachedir}'.")
 
-# get quantities and data from all found outfiles
-print(f"\nProcessing {len(files)} datafile(s):")
-for file in files:
-    # get lines from file, extract quantities and data
-    lines = getlines(file)
-    quants = getquants(lines)
-    data = getdata(lines)
+    # get quantities from all found outfiles, data is loaded after quantities have been defined
+    print(f"\nReading quantities of {len(files)} datafile(s):")
+    for file in files:
+        try:
+            quants, offset = readheader(file)
+        except OSError:
+            quants = []
 
-    # add dataset
-    if len(quants) > 0 and len(data) > 0:
-        name = file.replace(".out", "")
-        datasets.append(Dataset(name, quants, data))
-        print(f"Extracted data from file {os.path.relpath(file, sourcedir)}")
+        # add dataset
+        if len(quants) > 0:
+            name = os.path.splitext(file)[0].replace(os.sep, "-").replace("/", "-")
+            datasets.append(Dataset(name, quants, None, os.path.abspath(file), None))
+            print(f"Read quantities of file {os.path.relpath(file, sourcedir)}")
 
-    # skip file in no usable data has been found
-    else:
-        print(f"{Fore.RED}File {os.path.relpath(file, sourcedir)} is not in the correct format or could not be opened.\n{Style.RESET_ALL}")
+        # skip file in no usable data has been found
+        else:
+            print(f"{Fore.RED}File {os.path.relpath(file, sourcedir)} is not in the correct format or could not be opened.\n{Style.RESET_ALL}")
 
-input("\n\nPress 'Enter' to continue...")
+    countstage(files=len(datasets))
+    pause("\n\nPress 'Enter' to continue...")
 
 
 
-############################################################## QUANTITY PROCESSING ##############################################################
-print(f"{Style.BRIGHT}\n\n############################################################## QUANTITY PROCESSING ##############################################################{Style.RESET_ALL}")
-# change to source directory
-os.chdir(sourcedir)
+    ############################################################## QUANTITY PROCESSING ##############################################################
+    print(f"{Style.BRIGHT}\n\n############################################################## QUANTITY PROCESSING ##############################################################{Style.RESET_ALL}")
+    nextstage("QUANTITY PROCESSING")
+    # change to source directory
+    os.chdir(sourcedir)
 
-# definition of quantities
-quantities = []
+    # definition of quantities
+    registry = Registry()
 
-# extact quantities from datasets
-for dataset in datasets:
-    quants = dataset.getquants()
+    # extact quantities from datasets, counting the datafiles including each quantity
+    for dataset in datasets:
+        registry.adddataset(dataset)
+    quantities = registry.getquantities()
 
-    # empty quantity list
-    if len(quantities) == 0:
-        for quant in quants:
-            quantities.append(Quantity(quant, None, None, 0.0, 1.0))
+    # exit if no data was found
+    if registry.getcount() == 0:
+        print(f"{Fore.RED}No quantities were found in the provided datafiles.{Style.RESET_ALL}")
+        print(f"{Fore.RED}\n\nExiting program.{Style.RESET_ALL}")
+        sys.exit(1)
 
-    # quantity list with prior entries
-    else:
-        for quant in quants:
-            included = False
-
-            for ref in quantities:
-                # if quantity is already included, incement count by one
-                if quant == ref.getname():
-                    ref.addcount()
-                    included = True
-                    break
-                
-            # if a found quantity was not included, append it
-            if not included:
-                quantities.append(Quantity(quant, None, None, 0.0, 1.0))
 
-# exit if no data was found
-if len(quantities) == 0:
-    print(f"{Fore.RED}No quantities were found in the provided datafiles.{Style.RESET_ALL}")
-    print(f"{Fore.RED}\n\nExiting program.{Style.RESET_ALL}")
-    sys.exit()
+    # list found quantities
+    countstage(quantities=registry.getcount())
+    print(f"Found {registry.getcount()} quantities in the datafiles:")
+    for quant in quantities:
+        print(f"- '{quant.getname()}' included in {quant.getcount()} datafiles.")
 
+    pause("\n\nPress 'Enter' to continue...")
 
-# list found quantities
-print(f"Found {len(quantities)} quantities in the datafiles:")
-for quant in quantities:
-    print(f"- '{quant.getname()}' included in {quant.getcount()} datafiles.")
 
-input("\n\nPress 'Enter' to continue...")
+    # get reference quantites from file, changes are collected and written at once
+    try:
+        ref_registry = readreferences(reffile)
+    except FileNotFoundError:
+        ref_registry = Registry()
+        print(f"{Fore.RED}\n\nCould not find or open reference file {reffile}.{Style.RESET_ALL}")
+    ref_changes = {}
 
+    print()
 
-# get reference quantites from file
-ref_quantities = []
-try:
-    with open(reffile, "r") as file:
-        lines = file.readlines()
-        
-        for line in lines:
-            entries = line.strip().split(ref_delimiter)
+    # check for matches between current and reference quantities
+    for quant in quantities:
+        ref_quant = ref_registry.getquantity(quant.getname())
+        if ref_quant is not None:
+            print(f"\nFound references for quantity '{quant.getname()}':")
+            print(f"- type:           {ref_quant.gettype()}")
+            print(f"- description:    {ref_quant.getdescr()}")
+            print(f"- offset:         {ref_quant.getoffset()}")
+            print(f"- scaling factor: {ref_quant.getfactor()}\n")
             
-            # add reference quantity if its entries are valid
-            if len(entries) == 5:
-                ref_quantities.append(Quantity(entries[0], entries[1], entries[2], entries[3], entries[4]))
 
-        file.close()
-except FileNotFoundError:
-    print(f"{Fore.RED}\n\nCould not find or open reference file {reffile}.{Style.RESET_ALL}")
+            # query to use reference
+            q_useref = ynquery(f"quantities.{quant.getname()}.useref", f"Use references for quantity '{quant.getname()}'? (y/n)\n>>> ", f"quantities.{quant.getname()}.type" not in answers)
+
+            # copy reference parameters
+            if q_useref:
+                quant.settype(ref_quant.gettype())
+                quant.setdescr(ref_quant.getdescr())
+                quant.setoffset(ref_quant.getoffset())
+                quant.setfactor(ref_quant.getfactor())
 
-print()
 
-# check for matches between current and reference quantities
-if len(ref_quantities) > 0:
+    # enter attributes of remaining quantities
     for quant in quantities:
-        for ref_quant in ref_quantities:
-            if quant.getname() == ref_quant.getname():
-                print(f"\nFound references for quantity '{quant.getname()}':")
-                print(f"- type:           {ref_quant.gettype()}")
-                print(f"- description:    {ref_quant.getdescr()}")
-                print(f"- offset:         {ref_quant.getoffset()}")
-                print(f"- scaling factor: {ref_quant.getfactor()}\n")
+        if quant.gettype() == None:
+            while True:
+                q_type = answer(f"quantities.{quant.getname()}.type", f"\nDefine type of quantity '{quant.getname()}': none/xdata/ydata or n/x/y\n>>> ", "none").lower()
+
+                # quantity not to be plotted
+                if q_type == "none" or q_type == "n":
+                    quant.settype("none")
+                    quant.setdescr("none")
+                    quant.setoffset(0.0)
+                    quant.setfactor(0.0)
+                    break
+
+                # xdata definition
+                elif q_type == "xdata" or q_type == "x":
+                    setquantities(quant, "xdata")
+                    break
+
+                # ydata definition
+                elif q_type == "ydata" or q_type == "y":
+                    setquantities(quant, "ydata")
+                    break
+                else:
+                    invalid(f"quantities.{quant.getname()}.type", f"{Fore.RED}Invalid input.{Style.RESET_ALL}")
+
+            print()
+            # check if references for current quantity exist
+            refmatch = ref_registry.getquantity(quant.getname()) is not None
+            
+            # no references have been found
+            if not refmatch:
+                # add new quantity to references
+                q_addref = ynquery(f"quantities.{quant.getname()}.addref", f"Add settings for new quantity '{quant.getname()}' to reference file '{reffile}'? (y/n)\n>>> ", False)
                 
+                if q_addref:
+                    ref_changes[quant.getname()] = quant
+                    print(f"{Style.BRIGHT}Added settings for new quantity '{quant.getname()}.{Style.RESET_ALL}")
 
-                # query to use reference
-                q_useref = ynquery(f"Use references for quantity '{quant.getname()}'? (y/n)\n>>> ")
 
-                # copy reference parameters
-                if q_useref:
-                    quant.settype(ref_quant.gettype())
-                    quant.setdescr(ref_quant.getdescr())
-                    quant.setoffset(ref_quant.getoffset())
-                    quant.setfactor(ref_quant.getfactor())
-                break
+            # references have been found
+            else:
+                # update quantity in references
+                q_addref = ynquery(f"quantities.{quant.getname()}.updateref", f"Update settings for existing quantity '{quant.getname()}' in reference file '{reffile}'? (y/n)\n>>> ", False)
+                
+                if q_addref:
+                    ref_changes[quant.getname()] = quant
+                    print(f"{Style.BRIGHT}Updated settings for existing quantity '{quant.getname()}'.{Style.RESET_ALL}")
+
+    # write added and updated references
+    if len(ref_changes) > 0:
+        if not os.path.exists(reffile):
+            print(f"{Style.BRIGHT}The file '{reffile}' didn't exist. Created a new file.{Style.RESET_ALL}")
+        replaced, appended = writereferences(reffile, ref_changes)
+        print(f"{Style.BRIGHT}Wrote {appended} new and {replaced} updated quantities to reference file '{reffile}'.{Style.RESET_ALL}")
+                
 
+    # check if a least one xdata quantity and ydata quantity exist
+    xquantexists = False
+    yquantexists = False
 
-# enter attributes of remaining quantities
-for quant in quantities:
-    if quant.gettype() == None:
-        while True:
-            q_type = input(f"\nDefine type of quantity '{quant.getname()}': none/xdata/ydata or n/x/y\n>>> ").lower()
+    for quant in quantities:
+        if quant.gettype() == "xdata":
+            xquantexists = True
+        elif quant.gettype() == "ydata":
+            yquantexists = True
 
-            # quantity not to be plotted
-            if q_type == "none" or q_type == "n":
-                quant.settype("none")
-                quant.setdescr("none")
-                quant.setoffset(0.0)
-                quant.setfactor(0.0)
-                break
+    if not (xquantexists and yquantexists):   
+        print(f"{Fore.RED}\nAt least one xdata quantity and one ydata quantity have to be defined for data evaluation.{Style.RESET_ALL}")
+        print(f"{Fore.RED}\n\nExiting program.{Style.RESET_ALL}")
+        sys.exit(1)
 
-            # xdata definition
-            elif q_type == "xdata" or q_type == "x":
-                setquantities(quant, "xdata")
-                break
 
-            # ydata definition
-            elif q_type == "ydata" or q_type == "y":
-                setquantities(quant, "ydata")
-                break
-            else:
-                print(f"{Fore.RED}Invalid input.{Style.RESET_ALL}")
+    print(f"\nOverview over all {registry.getcount()} current quantities:")
+    for quant in quantities:
+        print(f"- Settings for quantity '{quant.getname()}':")
+        print(f"    - type:           {quant.gettype()}")
+        print(f"    - description:    {quant.getdescr()}")
+        print(f"    - offset:         {quant.getoffset()}")
+        print(f"    - scaling factor: {quant.getfactor()}\n")
+
+    pause("\nPress 'Enter' to continue...")
+
+
+    ################################################################ DATA PROCESSING ################################################################
+    print(f"{Style.BRIGHT}\n\n################################################################ DATA PROCESSING ################################################################{Style.RESET_ALL}")
+    nextstage("DATA PROCESSING")
+    # load data of datasets containing x and y quantities, only columns of x and y quantities are decoded
+    used = [dataset for dataset in datasets if len(registry.gettyped(dataset.getquants(), "xdata")) > 0 and len(registry.gettyped(dataset.getquants(), "ydata")) > 0]
+    names = [[quant.getname() for quant in registry.gettyped(dataset.getquants(), "xdata") + registry.gettyped(dataset.getquants(), "ydata")] for dataset in used]
+    loaded = set(loaddatasets(used, names))
+    datasets = [dataset for dataset in datasets if dataset in loaded or dataset not in used]
+    print()
 
-        print()
-        newline = quant.getref()
-        
-        # check if references for current quantity exist
-        refmatch = False
-        for ref_quant in ref_quantities:
-            if quant.getname() == ref_quant.getname():
-                refmatch = True
-                break
-        
-        # no references have been found
-        if not refmatch:
-            # add new quantity to references
-            q_addref = ynquery(f"Add settings for new quantity '{quant.getname()}' to reference file '{reffile}'? (y/n)\n>>> ")
-            
-            if q_addref:
-                # add to existing file
-                try:
-                    # add a line to the file
-                    with open(reffile, "a") as file:
-                        file.write(newline + "\n")
-                        file.close()
-                    print(f"{Style.BRIGHT}Added settings for new quantity '{quant.getname()}.{Style.RESET_ALL}")
+    # xy data
+    xydata = []
 
-                except FileNotFoundError:
-                    # if the file doesn't exist, create it and add a line
-                    with open(reffile, "w") as file:
-                        file.write(newline + "\n")
-                        file.close()
-                    print(f"{Style.BRIGHT}The file '{reffile}' didn't exist. Created a new file.{Style.RESET_ALL}")
+    print("Available yx datasets:")
+    # obtain valid xy data from datasets
+    for dataset in datasets:
+        # get x and y quantities of dataset
+        quants = dataset.getquants()
+        xquants = registry.gettyped(quants, "xdata")
+        yquants = registry.gettyped(quants, "ydata")
 
 
-        # references have been found
+        # check if dataset contains a single set of xy data
+        if len(xquants) == 1 and len(yquants) == 1:
+            singleset = True
         else:
-            # update quantity in references
-            q_addref = ynquery(f"Update settings for existing quantity '{quant.getname()}' in reference file '{reffile}'? (y/n)\n>>> ")
-            
-            if q_addref:
-                # get all lines from file
-                with open(reffile, "r") as file:
-                    # add a line to the file
-                    lines = file.readlines()
-                    file.close()
-
-                # find and replace line of quantity
-                for index in range(len(lines)):
-                    if lines[index].startswith(quant.getname()):
-                        lines[index] = newline + "\n"
-                        break
+            singleset = False
+        
+        # valid xy data only if at least one xquant and one yquant have been found
+        if len(xquants) > 0 and len(yquants) > 0:
+            print(f"- Dataset '{dataset.getname()}':")
 
-                # update existing file
-                with open(reffile, "w") as file:
-                    # add a line to the file
-                    file.writelines(lines)
-                    file.close()
-                
-                print(f"{Style.BRIGHT}Updated settings for existing quantity '{quant.getname()}'.{Style.RESET_ALL}")
+            # counting number of xydata sets in current dataset
+            datacount = 1
             
+            # format and scale x and y data, each column is computed once for all pairings, identical x data of all datasets is shared
+            columns = scalecolumns({quant.getname(): dataset.getcolumn(quant.getname()) for quant in xquants + yquants}, xquants + yquants)
+            for xquant in xquants:
+                columns[xquant.getname()] = internarray(columns[xquant.getname()])
+
+            # go through all x quantities
+            for xquant in xquants:
+                # go through all yquantites
+                for yquant in yquants:
+                    xdata = columns[xquant.getname()]
+                    ydata = columns[yquant.getname()]
+
+                    # define xy data header
+                    if singleset:
+                        header = dataset.getname()
+                    else:
+                        header = f"{dataset.getname()}-{datacount}"
+                    
+                    # define xy dataset
+                    xydata.append(XYdata(header, xquant, yquant, xdata, ydata, dataset))
+                    
+                    print(f"    - {header}:\n        - x: {xquant.getname()}\n        - y: {yquant.getname()}")
+                    datacount += 1
+            print()
 
-# check if a least one xdata quantity and ydata quantity exist
-xquantexists = False
-yquantexists = False
+        # invalid dataset
+        else:
+            print(f"{Fore.RED}Skipping dataset '{dataset.getname()}'.{Style.RESET_ALL} No valid xy data has been found.\n")
 
-for quant in quantities:
-    if quant.gettype() == "xdata":
-        xquantexists = True
-    elif quant.gettype() == "ydata":
-        yquantexists = True
 
-if not (xquantexists and yquantexists):   
-    print(f"{Fore.RED}\nAt least one xdata quantity and one ydata quantity have to be defined for data evaluation.{Style.RESET_ALL}")
-    print(f"{Fore.RED}\n\nExiting program.{Style.RESET_ALL}")
-    sys.exit()
+    # index xy datasets by quantities and descriptions
+    grouping = Grouping(xydata)
 
+    print(f"{Style.BRIGHT}\nCreated {len(xydata)} xy dataset(s) from {len(datasets)} dataset(s) found in {len(files)} file(s).{Style.RESET_ALL}")
+    countstage(files=len(datasets), rows=sum(dataset.getrows() for dataset in datasets), xydata=len(xydata))
+    pause("\n\nPress 'Enter' to continue...")
 
-print(f"\nOverview over all {len(quantities)} current quantities:")
-for quant in quantities:
-    print(f"- Settings for quantity '{quant.getname()}':")
-    print(f"    - type:           {quant.gettype()}")
-    print(f"    - description:    {quant.getdescr()}")
-    print(f"    - offset:         {quant.getoffset()}")
-    print(f"    - scaling factor: {quant.getfactor()}\n")
 
-input("\nPress 'Enter' to continue...")
 
+    ################################################################## FILE OUTPUT ##################################################################
+    print(f"{Style.BRIGHT}\n\n################################################################## FILE OUTPUT ##################################################################{Style.RESET_ALL}")
+    nextstage("FILE OUTPUT")
+    countstage(xydata=len(xydata))
+    # create files for xy datasets
+    q_datatofile = ynquery("output.write", "Write xy datasets to files? (y/n)\nExisting files of these datasets will be overwritten.\n>>> ", False)
 
-################################################################ DATA PROCESSING ################################################################
-print(f"{Style.BRIGHT}\n\n################################################################ DATA PROCESSING ################################################################{Style.RESET_ALL}")
-# xy data
-xydata = []
+    # file configuration
+    if q_datatofile:       
+        while True:
+            q_format = answer("output.format", "\nSpecify format of data to be written (m/o/n/h/p):\n    - m: Maple format: [[x1,y1],[x2,y2],...] in single line\n    - o: other format: pairs of x and y data in each line, separated by a delimiter\n    - n: NumPy format: compressed .npz archive\n    - h: HDF5 format: compressed .h5 file (requires package 'h5py')\n    - p: Parquet format: compressed .parquet file (requires package 'pyarrow')\n>>> ", "o").lower()
 
-print("Available yx datasets:")
-# obtain valid xy data from datasets
-for dataset in datasets:
-    # get data
-    data = dataset.getdata()
-    
-    # get quantities from dataset
-    xquants = []
-    yquants = []
-    quants = dataset.getquants()
-    
-    # go through current quantities
-    for quant in quants:
-        # go through defined quantities
-        for quantity in quantities:
-            # get quantity parameters for dataset
-            if quant == quantity.getname():
-                # get x quantities
-                if quantity.gettype() == "xdata":
-                    xquants.append(quantity)
+            # maple format
+            if q_format == "m":
+                print("")
                 
-                # get y quantities
-                if quantity.gettype() == "ydata":
-                    yquants.append(quantity)
-
+                # write all xydata to file
+                for data in xydata:
+                    # filename
+                    filename = data.getheader() + ".txt"
+                    
+                    # header lines
+                    lines = []
+                    lines.append(f"{data.getxquant().getname()}: {data.getxquant().getdescr()}\n")
+                    lines.append(f"{data.getyquant().getname()}: {data.getyquant().getdescr()}\n")
 
-    # check if dataset contains a single set of xy data
-    if len(xquants) == 1 and len(yquants) == 1:
-        singleset = True
-    else:
-        singleset = False
-    
-    # valid xy data only if at least one xquant and one yquant have been found
-    if len(xquants) > 0 and len(yquants) > 0:
-        print(f"- Dataset '{dataset.getname()}':")
+                    # write to file, data in a single line
+                    rowformat = f"[{numberformat()},{numberformat()}]"
+                    writexydata(filename, lines, data.getxdata(), data.getydata(), rowformat, ",", "[", "]\n")
 
-        # counting number of xydata sets in current dataset
-        datacount = 1
-        
-        # go through all x quantities
-        for xquant in xquants:
-            # go through all yquantites
-            for yquant in yquants:
-                # find index of x quantity 
-                for i in range(len(quants)):
-                    if quants[i] == xquant.getname():
-                        # extract x data at index position
-                        xdata = []
-                        for j in range(len(data)):
-                            # format and scale xdata
-                            xdata.append(xquant.getfactor()*(float(data[j][i]) + xquant.getoffset()))
-                        break
+                    print(f"Created file '{filename}'")
+                print()
+                break
 
-                # find index of y quantity 
-                for i in range(len(quants)):
-                    if quants[i] == yquant.getname():
-                        # extract y data at index position
-                        ydata = []
-                        for j in range(len(data)):
-                            ydata.append(yquant.getfactor()*(float(data[j][i]) + yquant.getoffset()))
-                        break
 
-                # define xy data header
-                if singleset:
-                    header = dataset.getname()
-                else:
-                    header = f"{dataset.getname()}-{datacount}"
+            # other format
+            elif q_format == "o":
                 
-                # define xy dataset
-                xydata.append(XYdata(header, xquant, yquant, xdata, ydata))
+                while True:
+                    q_delim = answer("output.delimiter", "\nSpecify delimiter between x and y data:\nGood options are a space, a comma or any common delimiter. Can only be a single character.\n>>> ", ",")
                 
-                print(f"    - {header}:\n        - x: {xquant.getname()}\n        - y: {yquant.getname()}")
-                datacount += 1
-        print()
-
-    # invalid dataset
-    else:
-        print(f"{Fore.RED}Skipping dataset '{dataset.getname()}'.{Style.RESET_ALL} No valid xy data has been found.\n")
+                    # check for single character delimiter
+                    if len(q_delim) == 1:
+                        break
 
+                    else:
+                        invalid("output.delimiter", f"{Fore.RED}Invalid delimiter.{Style.RESET_ALL}")
+                
+                # write all xydata to file
+                for data in xydata:
+                    # filename
+                    filename = data.getheader() + ".txt"
+                    
+                    # header lines
+                    lines = []
+                    lines.append(f"{data.getxquant().getname()}{q_delim}{data.getyquant().getname()}\n")
+                    lines.append(f"{data.getxquant().getdescr()}{q_delim}{data.getyquant().getdescr()}\n")
+                    
+                    # write to file, one line per pair of x and y data
+                    rowformat = numberformat() + q_delim.replace("%", "%%") + numberformat()
+                    writexydata(filename, lines, data.getxdata(), data.getydata(), rowformat, "\n", "", "\n")
 
-print(f"{Style.BRIGHT}\nCreated {len(xydata)} xy dataset(s) from {len(datasets)} dataset(s) found in {len(files)} file(s).{Style.RESET_ALL}")
-input("\n\nPress 'Enter' to continue...")
+                    print(f"Created file '{filename}'")
+                print()
+                break
 
+            # binary formats, x and y data stored as columns with quantity metadata
+            elif q_format in ("n", "h", "p"):
+                print("")
+                extension = {"n": ".npz", "h": ".h5", "p": ".parquet"}[q_format]
 
+                # write all xydata to file
+                try:
+                    for data in xydata:
+                        filename = data.getheader() + extension
+                        writebinary(filename, data)
+                        print(f"Created file '{filename}'")
+                except ImportError as error:
+                    invalid("output.format", f"{Fore.RED}Package '{error.name}' required for this format is not installed.{Style.RESET_ALL}")
+                    continue
+                print()
+                break
 
-################################################################## FILE OUTPUT ##################################################################
-print(f"{Style.BRIGHT}\n\n################################################################## FILE OUTPUT ##################################################################{Style.RESET_ALL}")
-# create files for xy datasets
-q_datatofile = ynquery("Write xy datasets to .txt files? (y/n)\nExisting files of these datasets will be overwritten.\n>>> ")
+            else:
+                invalid("output.format", f"{Fore.RED}Invalid input. Please enter one of the provided options.{Style.RESET_ALL}")
+
+    # write statistics of xy datasets
+    q_stats = ynquery("output.statistics", "\nWrite statistics of xy datasets to file 'statistics.txt'? (y/n)\n>>> ", False)
+    if q_stats:
+        writestatistics("statistics.txt", xydata)
+        print("Created file 'statistics.txt'")
+
+    # resample xy datasets with matching quantities onto common x grid
+    q_resample = ynquery("output.resample", f"\nResample xy datasets with matching quantities onto a common x grid? (y/n)\nOne table per combination of quantities is written, using {'linear interpolation' if resamplemethod == 'linear' else 'zero-order hold'}.\n>>> ", False)
+    if q_resample:
+        for sets in grouping.getgroups():
+            xname, yname = grouping.quantkey(sets[0])
+            key = f"output.resample.{xname}.{yname}"
+            while True:
+                q_grid = answer(f"{key}.grid", f"\nEnter x grid for '{yname}' over '{xname}' as start, stop and number of points separated by commas or spaces, leave empty for {resamplepoints} points covering all data:\n>>> ", "")
+                try:
+                    # entries separated by commas or spaces, lists from configuration are joined by spaces
+                    if q_grid.strip() == "":
+                        grid = resamplegrid(sets)
+                        break
+                    start, stop, points = re.split(r"[,\s]+", q_grid.strip())
+                    grid = np.linspace(float(start), float(stop), int(points))
+                    break
+                except ValueError:
+                    invalid(f"{key}.grid", f"{Fore.RED}Invalid grid.{Style.RESET_ALL}")
 
-# file configuration
-if q_datatofile:       
-    while True:
-        q_format = input("\nSpecify format of data to be written (m/o):\n    - m: Maple format: [[x1,y1],[x2,y2],...] in single line\n    - o: other format: pairs of x and y data in each line, separated by a delimiter\n>>> ").lower()
+            filename = f"resampled-{xname}-{yname}.txt"
+            writeresampled(filename, sets, grid, resample(sets, grid, resamplemethod))
+            print(f"Created file '{filename}' with {len(sets)} xy dataset(s) at {len(grid)} point(s)")
 
-        # maple format
-        if q_format == "m":
-            print("")
-            
-            # write all xydata to file
-            for data in xydata:
-                # filename
-                filename = data.getheader() + ".txt"
-                
-                # build lines
-                lines = []
-                lines.append(f"{data.getxquant().getname()}: {data.getxquant().getdescr()}\n")
-                lines.append(f"{data.getyquant().getname()}: {data.getyquant().getdescr()}\n")
-
-                # data lines
-                xdata = data.getxdata()
-                ydata = data.getydata()
-                dataline = "["
-                for i in range(len(xdata) - 1):
-                    dataline += f"[{xdata[i]},{ydata[i]}],"
-                dataline += f"[{xdata[-1]},{ydata[-1]}]]\n"
-
-                lines.append(dataline)
-
-                # write to file
-                with open(filename, "w") as file:
-                    # add a line to the file
-                    file.writelines(lines)
-                    file.close()
+    # write convergence of xy datasets
+    q_conv = ynquery("output.convergence", f"\nDetect convergence of xy datasets and write results to file 'convergence.txt'? (y/n)\nA dataset has converged when rolling averages of {convwindow} points stay within a relative tolerance of {convtol} of the settled value (or of the range of the data if larger).\n>>> ", False)
+    if q_conv:
+        converged = writeconvergence("convergence.txt", xydata)
+        print(f"Created file 'convergence.txt', {converged} of {len(xydata)} xy dataset(s) converged.")
 
-                print(f"Created file '{filename}'")
-            print()
-            break
+    # add datasets to result store
+    if storename != "":
+        q_store = ynquery("output.store", f"\nAdd datasets to result store '{storename}'? (y/n)\nStored datasets of unchanged files are kept, datasets of changed files are replaced.\n>>> ", False)
 
+        if q_store:
+            try:
+                added = writestore(os.path.join(sourcedir, storename), datasets, quantities)
+                print(f"Added {added} dataset(s) to result store '{storename}', kept {len(datasets) - added} unchanged dataset(s).")
+            except sqlite3.Error as error:
+                print(f"{Fore.RED}Could not write result store '{storename}': {error}{Style.RESET_ALL}")
 
-        # other format
-        elif q_format == "o":
-            
-            while True:
-                q_delim = input("\nSpecify delimiter between x and y data:\nGood options are a space, a comma or any common delimiter. Can only be a single character.\n>>> ")
-            
-                # check for single character delimiter
-                if len(q_delim) == 1:
-                    break
 
-                else:
-                    print(f"{Fore.RED}Invalid delimiter.{Style.RESET_ALL}")
-            
-            # write all xydata to file
-            for data in xydata:
-                # filename
-                filename = data.getheader() + ".txt"
-                
-                # build lines
-                lines = []
-                lines.append(f"{data.getxquant().getname()}{q_delim}{data.getyquant().getname()}\n")
-                lines.append(f"{data.getxquant().getdescr()}{q_delim}{data.getyquant().getdescr()}\n")
-                
-                # data lines
-                xdata = data.getxdata()
-                ydata = data.getydata()
 
-                for i in range(len(xdata)):
-                    lines.append(f"{xdata[i]}{q_delim}{ydata[i]}\n")
-                
-                # write to file
-                with open(filename, "w") as file:
-                    # add a line to the file
-                    file.writelines(lines)
-                    file.close()
+    #################################################################### PLOTTING ###################################################################
+    print(f"{Style.BRIGHT}\n#################################################################### PLOTTING ###################################################################{Style.RESET_ALL}")
+    nextstage("PLOTTING")
+    # create plots for xy datasets
+    q_datatoplot = ynquery("plots.create", "Create plots for xy datasets? (y/n)\nExisting plots of these datasets will be overwritten.\n>>> ", False)
 
-                print(f"Created file '{filename}'")
-            print()
-            break
+    if not q_datatoplot:
+        print(f"{Style.BRIGHT}{Fore.GREEN}\n##################################################################### DONE ######################################################################{Style.RESET_ALL}")
+        reportprofile()
+        sys.exit()
 
-        else:
-            print(f"{Fore.RED}Invalid input. Please enter one of the provided options.{Style.RESET_ALL}")
+    # all created plots
+    plots = []
 
 
+    # sort xy datasets by quantities
+    xydatasets = grouping.getgroups()
 
-#################################################################### PLOTTING ###################################################################
-print(f"{Style.BRIGHT}\n#################################################################### PLOTTING ###################################################################{Style.RESET_ALL}")
-# create plots for xy datasets
-q_datatoplot = ynquery("Create plots for xy datasets? (y/n)\nExisting plots of these datasets will be overwritten.\n>>> ")
+    # multiple datasets with matching quantities
+    multisets = False
 
-if not q_datatoplot:
-    print(f"{Style.BRIGHT}{Fore.GREEN}\n##################################################################### DONE ######################################################################{Style.RESET_ALL}")
-    sys.exit()
+    # print sorted datasets           
+    print("\nSorted xy datasets by matching quantities:")
+    for i in range(len(xydatasets)):
+        # x and y quantities of datasets
+        xquant = xydatasets[i][0].getxquant().getname()
+        yquant = xydatasets[i][0].getyquant().getname()
 
+        # check for multiple datasets with matching quantities
+        if len(xydatasets[i]) > 1:
+            multisets = True
+        
+        print(f"- {len(xydatasets[i])} set(s) with x quantity '{xquant}' and y quantity '{yquant}':")
+        for j in range(len(xydatasets[i])):
+            print(f"    - {xydatasets[i][j].getheader()}")
+        print()
+    print()
 
-# sort xy datasets by quantities
-xydatasets = []
 
-# find matching datasets
-for data in xydata:
-    # first entry
-    if len(xydatasets) == 0:
-        xydatasets.append([data])
+    # promt to create individual plots
+    q_iplot = ynquery("plots.individual.create", "Create individual plots for all xy datasets? (y/n)\n>>> ", False)
 
-    # prior entries
-    else:
-        # quantities of current xy dataset
-        xquant = data.getxquant().getname()
-        yquant = data.getyquant().getname()
+    # individual plot configuration
+    if q_iplot:
+        # title inclusion query
+        q_ititle = ynquery("plots.individual.title", "Include title for individual plots? (y/n)\n>>> ", False)
         
-        # look in entries of xydatasets for the same quantities
-        included = False
+        # title customization query
+        if q_ititle:
+            q_ititle_auto = ynquery("plots.individual.autotitle", "Auto-assign xy dataset name as title? (y/n)\n>>> ", True)
+        else: 
+            q_ititle_auto = False 
         
-        for index in range(len(xydatasets)):
-            # quantities in reference xy dataset in matches
-            refxquant = xydatasets[index][0].getxquant().getname()
-            refyquant = xydatasets[index][0].getyquant().getname()
-
-            # entry in matches already present
-            if xquant == refxquant and yquant == refyquant:
-                # add dataset to matches
-                xydatasets[index].append(data)
-                included = True
-                break
+        # match axes in case of multiple datasets
+        if multisets:
+            q_matchaxes = ynquery("plots.individual.matchaxes", "Match axis ranges between datasets with matching quantities? (y/n)\n>>> ", False)    
+        else:
+            q_matchaxes = False
 
-        # add new dataset if not included
-        if not included:
-            xydatasets.append([data])
 
-# multiple datasets with matching quantities
-multisets = False
+        # individual plot list
+        iplots = []
 
-# print sorted datasets           
-print("\nSorted xy datasets by matching quantities:")
-for i in range(len(xydatasets)):
-    # x and y quantities of datasets
-    xquant = xydatasets[i][0].getxquant().getname()
-    yquant = xydatasets[i][0].getyquant().getname()
 
-    # check for multiple datasets with matching quantities
-    if len(xydatasets[i]) > 1:
-        multisets = True
-    
-    print(f"- {len(xydatasets[i])} set(s) with x quantity '{xquant}' and y quantity '{yquant}':")
-    for j in range(len(xydatasets[i])):
-        print(f"    - {xydatasets[i][j].getheader()}")
-    print()
-print()
+        # create individual plots
+        for i in range(len(xydatasets)):
+            # x and y quantities of datasets
+            xquant = xydatasets[i][0].getxquant().getname()
+            yquant = xydatasets[i][0].getyquant().getname()
+            xdescr = xydatasets[i][0].getxquant().getdescr()
+            ydescr = xydatasets[i][0].getyquant().getdescr()
 
 
-# promt to create individual plots
-q_iplot = ynquery("Create individual plots for all xy datasets? (y/n)\n>>> ")
+            print(f"\nPlot configuration for plots with x quantity '{xquant}' and y quantity '{yquant}':")
+            key = f"plots.individual.{xquant}.{yquant}"
+            
 
-# individual plot configuration
-if q_iplot:
-    # title inclusion query
-    q_ititle = ynquery("Include title for individual plots? (y/n)\n>>> ")
-    
-    # title customization query
-    if q_ititle:
-        q_ititle_auto = ynquery("Auto-assign xy dataset name as title? (y/n)\n>>> ")
-    else: 
-        q_ititle_auto = False 
-    
-    # match axes in case of multiple datasets
-    if multisets:
-        q_matchaxes = ynquery("Match axis ranges between datasets with matching quantities? (y/n)\n>>> ")    
-    else:
-        q_matchaxes = False
+            # global axis ranges
+            if q_matchaxes:
+                # compute global ranges
+                # x values
+                xmin, xmax = getminmax(xydatasets[i], "xdata")
 
+                # y values
+                ymin, ymax = getminmax(xydatasets[i], "ydata")
 
-    # individual plot list
-    iplots = []
+                # output ranges
+                print("Computed axis range boundaries of set:")
+                print(f"- xmin: {xmin}\n- xmax: {xmax}")
+                print(f"- ymin: {ymin}\n- ymax: {ymax}\n")
 
 
-    # create individual plots
-    for i in range(len(xydatasets)):
-        # x and y quantities of datasets
-        xquant = xydatasets[i][0].getxquant().getname()
-        yquant = xydatasets[i][0].getyquant().getname()
-        xdescr = xydatasets[i][0].getxquant().getdescr()
-        ydescr = xydatasets[i][0].getyquant().getdescr()
+                # use computed ranges
+                q_bounds = ynquery(f"{key}.computedranges", "Use computed ranges? (y/n)\n>>> ", True)
+                
+                # manual input of ranges
+                if not q_bounds:
+                    # set x values
+                    xmin, xmax = setminmax(f"{key}.x", xdescr, xmin, xmax)
 
+                    # set y values
+                    ymin, ymax = setminmax(f"{key}.y", ydescr, ymin, ymax)
 
-        print(f"\nPlot configuration for plots with x quantity '{xquant}' and y quantity '{yquant}':")
-        
 
-        # global axis ranges
-        if q_matchaxes:
-            # compute global ranges
-            # x values
-            xmin, xmax = getminmax(xydatasets[i], "xdata")
+                # create plots
+                for j in range(len(xydatasets[i])):
+                    # data
+                    xdatasets = [xydatasets[i][j].getxdata()]
+                    ydatasets = [xydatasets[i][j].getydata()]
 
-            # y values
-            ymin, ymax = getminmax(xydatasets[i], "ydata")
+                    # legend
+                    legend = [xydatasets[i][j].getheader()]
 
-            # output ranges
-            print("Computed axis range boundaries of set:")
-            print(f"- xmin: {xmin}\n- xmax: {xmax}")
-            print(f"- ymin: {ymin}\n- ymax: {ymax}\n")
+                    # title
+                    if q_ititle:
+                        if q_ititle_auto:
+                            title = xydatasets[i][j].getheader()
+                        else:
+                            title = answer(f"plots.individual.{xydatasets[i][j].getheader()}.title", f"\nEnter title of plot {xydatasets[i][j].getheader()}:\n>>> ", xydatasets[i][j].getheader())
+                            print()
+                    else:
+                        title = ""
 
+                    # name
+                    if title == "":
+                        name = xydatasets[i][j].getheader()
+                    else:
+                        name = xydatasets[i][j].getheader().replace(" ", "-")
 
-            # use computed ranges
-            q_bounds = ynquery("Use computed ranges? (y/n)\n>>> ")
+                    iplots.append(Plot(name, title, xdescr, ydescr, xdatasets, ydatasets, xmin, xmax, ymin, ymax, legend, [xydatasets[i][j]]))
+                print()
             
-            # manual input of ranges
-            if not q_bounds:
-                # set x values
-                xmin, xmax = setminmax(xdescr, xmin, xmax)
 
-                # set y values
-                ymin, ymax = setminmax(ydescr, ymin, ymax)
+            # individual axis ranges
+            else:
+                # define global ranges
+                q_bounds = ynquery(f"{key}.computedranges", f"Automatically use computed axis ranges for plots with x quantity '{xquant}' and y quantity '{yquant}'? (y/n)\n>>> ", True)
+                
+                # define plots individually
+                for j in range(len(xydatasets[i])):
+                    # compute ranges
+                    # x values
+                    xmin, xmax = getminmax([xydatasets[i][j]], "xdata")
 
+                    # y values
+                    ymin, ymax = getminmax([xydatasets[i][j]], "ydata")
 
-            # create plots
-            for j in range(len(xydatasets[i])):
-                # data
-                xdatasets = [xydatasets[i][j].getxdata()]
-                ydatasets = [xydatasets[i][j].getydata()]
 
-                # legend
-                legend = [xydatasets[i][j].getheader()]
+                    # manual input of ranges
+                    if not q_bounds:
+                        print(f"Enter axis ranges for plot {xydatasets[i][j].getheader()}:")
+                        
+                        # set x values
+                        xmin, xmax = setminmax(f"plots.individual.{xydatasets[i][j].getheader()}.x", xdescr, xmin, xmax)
 
-                # title
-                if q_ititle:
-                    if q_ititle_auto:
-                        title = xydatasets[i][j].getheader()
-                    else:
-                        title = input(f"\nEnter title of plot {xydatasets[i][j].getheader()}:\n>>> ")
-                        print()
-                else:
-                    title = ""
+                        # set y values
+                        ymin, ymax = setminmax(f"plots.individual.{xydatasets[i][j].getheader()}.y", ydescr, ymin, ymax)
 
-                # name
-                if title == "":
-                    name = xydatasets[i][j].getheader()
-                else:
-                    name = xydatasets[i][j].getheader().replace(" ", "-")
 
-                iplots.append(Plot(name, title, xdescr, ydescr, xdatasets, ydatasets, xmin, xmax, ymin, ymax, legend))
-            print()
-        
+                    # create plot
+                    # data
+                    xdatasets = [xydatasets[i][j].getxdata()]
+                    ydatasets = [xydatasets[i][j].getydata()]
 
-        # individual axis ranges
-        else:
-            # define global ranges
-            q_bounds = ynquery(f"Automatically use computed axis ranges for plots with x quantity '{xquant}' and y quantity '{yquant}'? (y/n)\n>>> ")
-            
-            # define plots individually
-            for j in range(len(xydatasets[i])):
-                # compute ranges
-                # x values
-                xmin, xmax = getminmax([xydatasets[i][j]], "xdata")
+                    # legend
+                    legend = [xydatasets[i][j].getheader()]
 
-                # y values
-                ymin, ymax = getminmax([xydatasets[i][j]], "ydata")
+                    # title
+                    if q_ititle:
+                        if q_ititle_auto:
+                            title = xydatasets[i][j].getheader()
+                        else:
+                            title = answer(f"plots.individual.{xydatasets[i][j].getheader()}.title", f"\nEnter title of plot {xydatasets[i][j].getheader()}:\n>>> ", xydatasets[i][j].getheader())
+                            print()
+                    else:
+                        title = ""
 
+                    # name
+                    if title == "":
+                        name = xydatasets[i][j].getheader()
+                    else:
+                        name = xydatasets[i][j].getheader().replace(" ", "-")
 
-                # manual input of ranges
-                if not q_bounds:
-                    print(f"Enter axis ranges for plot {xydatasets[i][j].getheader()}:")
-                    
-                    # set x values
-                    xmin, xmax = setminmax(xdescr, xmin, xmax)
+                    iplots.append(Plot(name, title, xdescr, ydescr, xdatasets, ydatasets, xmin, xmax, ymin, ymax, legend, [xydatasets[i][j]]))
+                print()
 
-                    # set y values
-                    ymin, ymax = setminmax(ydescr, ymin, ymax)
 
+        # output individual plots to file
+        print("Creating individual plots:")
+        createplots(iplots)
+        plots.extend(iplots)
+        print()
+        print()
 
-                # create plot
-                # data
-                xdatasets = [xydatasets[i][j].getxdata()]
-                ydatasets = [xydatasets[i][j].getydata()]
 
-                # legend
-                legend = [xydatasets[i][j].getheader()]
+    # promt to create combined plots
+    enoughsets = False
+    for datasets in xydatasets:
+        if len(datasets) > 1:
+            enoughsets = True
 
-                # title
-                if q_ititle:
-                    if q_ititle_auto:
-                        title = xydatasets[i][j].getheader()
-                    else:
-                        title = input(f"\nEnter title of plot {xydatasets[i][j].getheader()}:\n>>> ")
-                        print()
-                else:
-                    title = ""
+    if enoughsets:
+        q_mplot = ynquery("plots.combined.create", "Create combined plots with multiple xy datasets? (y/n)\n>>> ", False)
+    else:
+        print(f"{Fore.RED}Not enough datasets to create combined plots.{Style.RESET_ALL}")
+        q_mplot = False
 
-                # name
-                if title == "":
-                    name = xydatasets[i][j].getheader()
-                else:
-                    name = xydatasets[i][j].getheader().replace(" ", "-")
 
-                iplots.append(Plot(name, title, xdescr, ydescr, xdatasets, ydatasets, xmin, xmax, ymin, ymax, legend))
-            print()
+    # combined plot configuration
+    if q_mplot:
+        # title inclusion query
+        q_mtitle = ynquery("plots.combined.title", "Include title for combined plots? (y/n)\n>>> ", False)
 
+        # title customization query
+        if q_mtitle:
+            q_mtitle_auto = ynquery("plots.combined.autotitle", "Auto-assign 'Comparison of...' as title? (y/n)\n>>> ", True)
+        else: 
+            q_mtitle_auto = False 
 
-    # output individual plots to file
-    print("Creating individual plots:")
-    for plot in iplots:
-        createplot(plot)
-    print()
-    print()
 
+        # combined plot list
+        mplots = []
 
-# promt to create combined plots
-enoughsets = False
-for datasets in xydatasets:
-    if len(datasets) > 1:
-        enoughsets = True
 
-if enoughsets:
-    q_mplot = ynquery("Create combined plots with multiple xy datasets? (y/n)\n>>> ")
-else:
-    print(f"{Fore.RED}Not enough datasets to create combined plots.{Style.RESET_ALL}")
-    q_mplot = False
+        # all plots with matching quantities
+        if multisets:
+            # check if more than one dataset exist per x quantity and y quantity combination
+            for i in range(len(xydatasets)):
+                if len(xydatasets[i]) > 1:
+                    # x and y quantities of datasets
+                    xquant = xydatasets[i][0].getxquant().getname()
+                    yquant = xydatasets[i][0].getyquant().getname()
+                    xdescr = xydatasets[i][0].getxquant().getdescr()
+                    ydescr = xydatasets[i][0].getyquant().getdescr()
+                    
+                    # output datasets
+                    print(f"Datasets with x quantity '{xquant}' and y quantity '{yquant}':")
+                    for j in range(len(xydatasets[i])):
+                        print(f"- {xydatasets[i][j].getheader()}")
+                    print()
 
+                    # create plots with multiple datasets
+                    key = f"plots.combined.{xquant}.{yquant}"
+                    q_multi = ynquery(f"{key}.create", "Create a combined plot with all of the above xy datasets? (y/n)\n>>> ", True)
 
-# combined plot configuration
-if q_mplot:
-    # title inclusion query
-    q_mtitle = ynquery("Include title for combined plots? (y/n)\n>>> ")
+                    if q_multi:
+                        # compute global ranges
+                        # x values
+                        xmin, xmax = getminmax(xydatasets[i], "xdata")
 
-    # title customization query
-    if q_mtitle:
-        q_mtitle_auto = ynquery("Auto-assign 'Comparison of...' as title? (y/n)\n>>> ")
-    else: 
-        q_mtitle_auto = False 
+                        # y values
+                        ymin, ymax = getminmax(xydatasets[i], "ydata")
 
+                        # output ranges
+                        print("Computed axis range boundaries of set:")
+                        print(f"- xmin: {xmin}\n- xmax: {xmax}")
+                        print(f"- ymin: {ymin}\n- ymax: {ymax}\n")
 
-    # combined plot list
-    mplots = []
 
+                        # use computed ranges
+                        q_bounds = ynquery(f"{key}.computedranges", "Use computed ranges? (y/n)\n>>> ", True)
+                        
+                        # manual input of ranges
+                        if not q_bounds:
+                            # set x values
+                            xmin, xmax = setminmax(f"{key}.x", xdescr, xmin, xmax)
+
+                            # set y values
+                            ymin, ymax = setminmax(f"{key}.y", ydescr, ymin, ymax)
+
+
+                        # create plot
+                        # data
+                        xdatasets = []
+                        ydatasets = []
+
+                        # legend
+                        legend = []
+
+                        for j in range(len(xydatasets[i])):
+                            xdatasets.append(xydatasets[i][j].getxdata())
+                            ydatasets.append(xydatasets[i][j].getydata())
+                            legend.append(xydatasets[i][j].getheader().replace(f"-{yquant}", "").replace(f"{yquant}", ""))
+
+                        # title
+                        if q_mtitle:
+                            if q_mtitle_auto:
+                                title = f"Comparison of {ydescr}"
+                            else:
+                                title = answer(f"{key}.title", f"\nEnter title of plot with x quantity '{xquant}' and y quantity '{yquant}':\n>>> ", f"Comparison of {ydescr}")
+                                print()
+                        else:
+                            title = ""
 
-    # all plots with matching quantities
-    if multisets:
-        # check if more than one dataset exist per x quantity and y quantity combination
-        for i in range(len(xydatasets)):
-            if len(xydatasets[i]) > 1:
-                # x and y quantities of datasets
-                xquant = xydatasets[i][0].getxquant().getname()
-                yquant = xydatasets[i][0].getyquant().getname()
-                xdescr = xydatasets[i][0].getxquant().getdescr()
-                ydescr = xydatasets[i][0].getyquant().getdescr()
+                        # name
+                        if title == "":
+                            name = f"Comparison of {ydescr}"
+                            name = name.replace(" ", "-")
+                            name = re.sub(re.compile(r"-\[.*?\]"), "", name)
+                        else:
+                            name = title.replace(" ", "-")
+                            name = re.sub(re.compile(r"-\[.*?\]"), "", name)
+
+                        mplots.append(Plot(name, title, xdescr, ydescr, xdatasets, ydatasets, xmin, xmax, ymin, ymax, legend, xydatasets[i]))
+                    print()
+
+
+        # other combinations of data
+        count = 0
+        attempt = 0
+        
+        while True:        
+            attempt += 1
+            key = f"plots.combined.other.{attempt}"
+            q_other = ynquery(f"{key}.create", "Create other combinations of xy datasets? (y/n)\nThe descriptions of all quantities must match in order to be plotted together.\n>>> ", False)
+            
+            if q_other:
+                print("\nAvailable xy datasets:")
+                for i in range(len(xydata)):
+                    print(f"- {i+1}: {xydata[i].getheader()}")
+                print()
                 
-                # output datasets
-                print(f"Datasets with x quantity '{xquant}' and y quantity '{yquant}':")
-                for j in range(len(xydatasets[i])):
-                    print(f"- {xydatasets[i][j].getheader()}")
+                # get numbers or headers of datasets
+                datanums = answerlist(f"{key}.sets", "Enter the numbers of xy datasets for plotting, separated by spaces:\n>>> ")
+                sets = []
+                selected = set()
+
                 print()
 
-                # create plots with multiple datasets
-                q_multi = ynquery("Create a combined plot with all of the above xy datasets? (y/n)\n>>> ")
+                # add valid files
+                for i in range(len(datanums)):
+                    try:
+                        # headers are accepted as well
+                        if grouping.getposition(datanums[i]) is not None:
+                            entry = grouping.getposition(datanums[i]) + 1
+                        else:
+                            entry = int(datanums[i])
+
+                        # number has to match outfile list entry
+                        if entry <= len(xydata):
+                            # add to empty list
+                            if len(sets) == 0:
+                                sets.append(xydata[entry-1])
+                                selected.add(xydata[entry-1].getheader())
+                                
+                                # quantity descriptions of reference list entry
+                                setxdescr, setydescr = grouping.descrkey(sets[0])
+                            
+                            # check for double entries
+                            elif xydata[entry-1].getheader() in selected:
+                                print(f"Number {Fore.RED}'{datanums[i]}'{Style.RESET_ALL} has multiple entries. Dataset added only once to current selection.")
+
+                            # check for matching quantity descriptions
+                            elif grouping.descrkey(xydata[entry-1]) == (setxdescr, setydescr):
+                                sets.append(xydata[entry-1])
+                                selected.add(xydata[entry-1].getheader())
+                            else:
+                                print(f"Number {Fore.RED}'{datanums[i]}'{Style.RESET_ALL} does not match set quantities.")
+
+                        # number does not match list entries
+                        else:
+                            print(f"Number {Fore.RED}'{datanums[i]}'{Style.RESET_ALL} is invalid.")    
+
+                    # not a valid number, number conversion failed
+                    except ValueError:
+                        print(f"Number {Fore.RED}'{datanums[i]}'{Style.RESET_ALL} is invalid.")    
+                        
+
+                # record headers, numbers depend on the order of found files
+                recorded[f"{key}.sets"] = [data.getheader() for data in sets]
 
-                if q_multi:
+                # create plot
+                if len(sets) > 1:
+                    count += 1
+                    
                     # compute global ranges
                     # x values
-                    xmin, xmax = getminmax(xydatasets[i], "xdata")
+                    xmin, xmax = getminmax(sets, "xdata")
 
                     # y values
-                    ymin, ymax = getminmax(xydatasets[i], "ydata")
+                    ymin, ymax = getminmax(sets, "ydata")
 
                     # output ranges
                     print("Computed axis range boundaries of set:")
@@ -1189,15 +3040,15 @@ if q_mplot:
 
 
                     # use computed ranges
-                    q_bounds = ynquery("Use computed ranges? (y/n)\n>>> ")
+                    q_bounds = ynquery(f"{key}.computedranges", "Use computed ranges? (y/n)\n>>> ", True)
                     
                     # manual input of ranges
                     if not q_bounds:
                         # set x values
-                        xmin, xmax = setminmax(xdescr, xmin, xmax)
+                        xmin, xmax = setminmax(f"{key}.x", setxdescr, xmin, xmax)
 
                         # set y values
-                        ymin, ymax = setminmax(ydescr, ymin, ymax)
+                        ymin, ymax = setminmax(f"{key}.y", setydescr, ymin, ymax)
 
 
                     # create plot
@@ -1208,172 +3059,90 @@ if q_mplot:
                     # legend
                     legend = []
 
-                    for j in range(len(xydatasets[i])):
-                        xdatasets.append(xydatasets[i][j].getxdata())
-                        ydatasets.append(xydatasets[i][j].getydata())
-                        legend.append(xydatasets[i][j].getheader().replace(f"-{yquant}", "").replace(f"{yquant}", ""))
+                    for i in range(len(sets)):
+                        xdatasets.append(sets[i].getxdata())
+                        ydatasets.append(sets[i].getydata())
+                        yquant = sets[i].getyquant().getname()
+                        legend.append(sets[i].getheader().replace(f"-{yquant}", "").replace(f"{yquant}", ""))
 
                     # title
                     if q_mtitle:
                         if q_mtitle_auto:
-                            title = f"Comparison of {ydescr}"
+                            title = f"Comparison of {setydescr}"
                         else:
-                            title = input(f"\nEnter title of plot with x quantity '{xquant}' and y quantity '{yquant}':\n>>> ")
+                            title = answer(f"{key}.title", f"\nEnter title of plot:\n>>> ", f"Comparison of {setydescr}")
                             print()
                     else:
                         title = ""
 
                     # name
                     if title == "":
-                        name = f"Comparison of {ydescr}"
+                        name = f"Comparison of {setydescr}"
                         name = name.replace(" ", "-")
                         name = re.sub(re.compile(r"-\[.*?\]"), "", name)
+                        name += f"-set{count}"
                     else:
                         name = title.replace(" ", "-")
                         name = re.sub(re.compile(r"-\[.*?\]"), "", name)
+                        name += f"-set{count}"
 
-                    mplots.append(Plot(name, title, xdescr, ydescr, xdatasets, ydatasets, xmin, xmax, ymin, ymax, legend))
-                print()
-
-
-    # other combinations of data
-    count = 0
-    
-    while True:        
-        q_other = ynquery("Create other combinations of xy datasets? (y/n)\nThe descriptions of all quantities must match in order to be plotted together.\n>>> ")
-        
-        if q_other:
-            print("\nAvailable xy datasets:")
-            for i in range(len(xydata)):
-                print(f"- {i+1}: {xydata[i].getheader()}")
-            print()
-            
-            # get numbers of datasets
-            datanums = input("Enter the numbers of xy datasets for plotting, separated by spaces:\n>>> ").strip().split()
-            sets = []
-
-            print()
-
-            # add valid files
-            for i in range(len(datanums)):
-                try:
-                    entry = int(datanums[i])
-
-                    # number has to match outfile list entry
-                    if entry <= len(xydata):
-                        # add to empty list
-                        if len(sets) == 0:
-                            sets.append(xydata[entry-1])
-                            
-                            # quantities of reference list entry
-                            setxdescr = sets[0].getxquant().getdescr()
-                            setydescr = sets[0].getyquant().getdescr()
-                        
-                        # check for double entries
-                        else:
-                            included = False
-                            
-                            for set in sets:
-                                if set.getheader() == xydata[entry-1].getheader():
-                                    included = True
-                                    print(f"Number {Fore.RED}'{datanums[i]}'{Style.RESET_ALL} has multiple entries. Dataset added only once to current selection.")
-                                    break
-                            
-                            if not included:
-                                # quantities of current entry
-                                xdescr = xydata[entry-1].getxquant().getdescr()
-                                ydescr = xydata[entry-1].getyquant().getdescr()
-                                
-                                # check for matching quantity descriptions
-                                if xdescr == setxdescr and ydescr == setydescr:
-                                    sets.append(xydata[entry-1])
-                                else:
-                                    print(f"Number {Fore.RED}'{datanums[i]}'{Style.RESET_ALL} does not match set quantities.")
-
-                    # number does not match list entries
-                    else:
-                        print(f"Number {Fore.RED}'{datanums[i]}'{Style.RESET_ALL} is invalid.")    
-
-                # not a valid number, number conversion failed
-                except ValueError:
-                    print(f"Number {Fore.RED}'{datanums[i]}'{Style.RESET_ALL} is invalid.")    
-                    
-
-            # create plot
-            if len(sets) > 1:
-                count += 1
-                
-                # compute global ranges
-                # x values
-                xmin, xmax = getminmax(sets, "xdata")
-
-                # y values
-                ymin, ymax = getminmax(sets, "ydata")
-
-                # output ranges
-                print("Computed axis range boundaries of set:")
-                print(f"- xmin: {xmin}\n- xmax: {xmax}")
-                print(f"- ymin: {ymin}\n- ymax: {ymax}\n")
-
+                    mplots.append(Plot(name, title, xdescr, ydescr, xdatasets, ydatasets, xmin, xmax, ymin, ymax, legend, sets))
+                    print()
 
-                # use computed ranges
-                q_bounds = ynquery("Use computed ranges? (y/n)\n>>> ")
-                
-                # manual input of ranges
-                if not q_bounds:
-                    # set x values
-                    xmin, xmax = setminmax(setxdescr, xmin, xmax)
+                else:
+                    print(f"{Fore.RED}Found less than 2 plottable datasets.{Style.RESET_ALL} Skipping creation of combined plot.\n\n")
+            else:
+                break
 
-                    # set y values
-                    ymin, ymax = setminmax(setydescr, ymin, ymax)
+        # output combined plots to file
+        print("\nCreating combined plots:")
+        createplots(mplots)
+        plots.extend(mplots)
 
 
-                # create plot
-                # data
-                xdatasets = []
-                ydatasets = []
-
-                # legend
-                legend = []
-
-                for i in range(len(sets)):
-                    xdatasets.append(sets[i].getxdata())
-                    ydatasets.append(sets[i].getydata())
-                    yquant = sets[i].getyquant().getname()
-                    legend.append(sets[i].getheader().replace(f"-{yquant}", "").replace(f"{yquant}", ""))
-
-                # title
-                if q_mtitle:
-                    if q_mtitle_auto:
-                        title = f"Comparison of {setydescr}"
-                    else:
-                        title = input(f"\nEnter title of plot:\n>>> ")
-                        print()
-                else:
-                    title = ""
-
-                # name
-                if title == "":
-                    name = f"Comparison of {setydescr}"
-                    name = name.replace(" ", "-")
-                    name = re.sub(re.compile(r"-\[.*?\]"), "", name)
-                    name += f"-set{count}"
-                else:
-                    name = title.replace(" ", "-")
-                    name = re.sub(re.compile(r"-\[.*?\]"), "", name)
-                    name += f"-set{count}"
-
-                mplots.append(Plot(name, title, xdescr, ydescr, xdatasets, ydatasets, xmin, xmax, ymin, ymax, legend))
-                print()
+    # follow datafiles which are still being written
+    countstage(plots=len(plots))
+    if len(plots) > 0:
+        print()
+        q_follow = ynquery("follow", f"Follow datafiles and update plots when new data is written? (y/n)\nFiles are checked every {followinterval} s, stop with 'Ctrl+C'.\n>>> ", False)
 
-            else:
-                print(f"{Fore.RED}Found less than 2 plottable datasets.{Style.RESET_ALL} Skipping creation of combined plot.\n\n")
-        else:
-            break
+        if q_follow:
+            nextstage("FOLLOW")
 
-    # output combined plots to file
-    print("\nCreating combined plots:")
-    for plot in mplots:
-        createplot(plot)
+            # xy datasets included in plots
+            followsets = []
+            for plot in plots:
+                for data in plot.getsets():
+                    if data not in followsets:
+                        followsets.append(data)
+            countstage(xydata=len(followsets))
 
-print(f"{Style.BRIGHT}{Fore.GREEN}\n\n##################################################################### DONE ######################################################################{Style.RESET_ALL}")
\ No newline at end of file
+            try:
+                while True:
+                    time.sleep(followinterval)
+                    updated = updatexydata(followsets)
+
+                    # update plots containing new data
+                    updateplots = []
+                    for plot in plots:
+                        new = [updated[data] for data in plot.getsets() if data in updated]
+                        if len(new) == 0:
+                            continue
+
+                        # extend axis ranges to new data
+                        xmin, xmax, ymin, ymax = plot.getxmin(), plot.getxmax(), plot.getymin(), plot.getymax()
+                        for xdata, ydata in new:
+                            xmin, xmax = min(xmin, np.min(xdata)), max(xmax, np.max(xdata))
+                            ymin, ymax = min(ymin, np.min(ydata)), max(ymax, np.max(ydata))
+                        plot.setranges(xmin, xmax, ymin, ymax)
+                        plot.setdata([data.getxdata() for data in plot.getsets()], [data.getydata() for data in plot.getsets()])
+                        updateplots.append(plot)
+
+                    if len(updateplots) > 0:
+                        createplots(updateplots)
+
+            except KeyboardInterrupt:
+                print("\nStopped following datafiles.")
+
+    print(f"{Style.BRIGHT}{Fore.GREEN}\n\n##################################################################### DONE ######################################################################{Style.RESET_ALL}")
+    reportprofile()
\ No newline at end of file